@@ -2,9 +2,9 @@
 # Copyright (c) 2026 Henry Gurney
 # Licensed under CC BY-NC-ND 4.0
 
-__version__ = "1.5" # NB all minor atomic versions are assumed by games to be backward compatible
+__version__ = "1.6" # NB all minor atomic versions are assumed by games to be backward compatible
 
-from .graphics import BlendRGB565, BlitTileToBuffer, BlitTransparentSprite, HEXto565, RGBto565, SetPixel, ScaleSprite
-from .tileutils import GetCoveredTileCoords, GetTileCoords, GetCoveredTileCoordsPacked, GetTileCoordsPacked
+from .graphics import BlendBuffer, BlendLUT, BlendRGB565, BlitRect, BlitSpans, CompileSpans, BlitTileToBuffer, BlitTransparentSprite, HEXto565, RGBto565, SetPixel, ScaleSprite
+from .tileutils import GetCoveredTileCoords, GetTileCoords, GetCoveredTileCoordsPacked, GetTileCoordsPacked, GetCoveredTileBounds, GetCoveredTiles
 from .utilities import Pressed, DrawText, WrapText, BellCurve
-from .textbox import CreateTextBox, Print, Flush
+from .textbox import CreateTextBox, Print, Flush, DrawTextBox
@@ -0,0 +1,100 @@
+import time # only MicroPython's time has the ticks functions, so they're looked up when called
+
+# Loop modes
+ONCE = 0 # stop on the last frame
+LOOP = 1
+PINGPONG = 2 # forwards then backwards, without repeating the end frames
+
+class Animator:
+    # Plays keyframe animations for any number of sprites off one shared clock. The frame shown is
+    # worked out from the time since the animation started, so a slow frame skips animation frames
+    # rather than slowing the animation down, and Update() reports only the sprites whose frame
+    # actually changed, so nothing else needs redrawing
+    def __init__(self, atlas=None):
+        self.atlas = atlas
+        self.clips = {} # name -> [frames, end time of each frame, total length, mode]
+        self.sprites = {} # sprite -> [clip, start time, position in clip, frame, finished]
+        self.changed = [] # sprites whose frame changed on the last Update()
+        self.now = 0 # time of the last Update()
+
+    def Add(self, name, frames, frameMs=100, mode=LOOP):
+        # frames are atlas frame names or numbers, or any values if there's no atlas. frameMs is one
+        # duration for every frame or a list with one per frame
+        durations = list(frameMs) if isinstance(frameMs, (list, tuple)) else [frameMs] * len(frames)
+        if len(durations) != len(frames):
+            raise ValueError("need one duration per frame")
+        if self.atlas is not None:
+            frames = [self.atlas.Index(f) if isinstance(f, str) else f for f in frames]
+        else:
+            frames = list(frames)
+        if mode == PINGPONG and len(frames) > 2:
+            frames += frames[-2:0:-1]
+            durations += durations[-2:0:-1]
+
+        ends = []
+        total = 0
+        for ms in durations:
+            total += ms
+            ends.append(total)
+        self.clips[name] = [frames, ends, total, mode]
+
+    def Play(self, sprite, name, nowMs=None, restart=False):
+        # Start sprite (any key, e.g. a SpriteBatch slot) on an animation. Playing the animation it's
+        # already on does nothing unless restart is set, so it can be called every frame. A nowMs
+        # in the future delays the start, e.g. to chain one sprite's animation after another's
+        s = self.sprites.get(sprite)
+        clip = self.clips[name]
+        if s is not None and s[0] is clip and not restart:
+            return
+        start = time.ticks_ms() if nowMs is None else nowMs
+        self.sprites[sprite] = [clip, start, -1, clip[0][0], False] # -1 so the next Update() reports it
+
+    def Stop(self, sprite):
+        self.sprites.pop(sprite, None)
+
+    def Update(self, nowMs=None, batch=None):
+        # Move every sprite on to the frame due at nowMs; returns how many changed frame. If a
+        # SpriteBatch is given, sprites keyed by slot number get their new frame set in it
+        now = time.ticks_ms() if nowMs is None else nowMs
+        self.now = now
+        changed = self.changed
+        changed.clear()
+        for sprite, s in self.sprites.items():
+            if s[4]:
+                continue
+            frames, ends, total, mode = s[0]
+            t = time.ticks_diff(now, s[1])
+            if t < 0:
+                continue # not started yet
+            if mode == ONCE:
+                if t >= total:
+                    t = total - 1
+                    s[4] = True
+            else:
+                t %= total
+
+            i = 0
+            while ends[i] <= t:
+                i += 1
+            if i != s[2]:
+                s[2] = i
+                s[3] = frames[i]
+                changed.append(sprite)
+                if batch is not None and isinstance(sprite, int):
+                    batch.records[(sprite << 2) + 2] = frames[i]
+        return len(changed)
+
+    def Changed(self, sprite):
+        return sprite in self.changed
+
+    def Frame(self, sprite):
+        # The sprite's current frame: an atlas frame number, or the value given to Add()
+        return self.sprites[sprite][3]
+
+    def Pixels(self, sprite):
+        return self.atlas.Frame(self.sprites[sprite][3])
+
+    def Done(self, sprite):
+        # True once a ONCE animation has reached its last frame, or if the sprite isn't playing
+        s = self.sprites.get(sprite)
+        return s is None or s[4]
@@ -0,0 +1,109 @@
+import os
+from atomic.frozen import FrozenPack
+
+# Asset files cached under one byte budget shared by everything that loads through this module.
+# Each file is read once, straight into a buffer of its exact size with readinto. Pinned assets
+# are never evicted; the rest go least recently used first. Assets can come from a Pack as well
+# as from loose files; frozen assets are already readable in place, so they're never cached
+
+def _Key(path, pack):
+    return path if pack is None else pack.path + ":" + path
+
+class AssetCache:
+    def __init__(self, budget=65536):
+        self.budget = budget
+        self.used = 0
+        self.entries = {} # key -> [buf, lastUse, pins]
+        self.tick = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def Load(self, path, pin=False, pack=None):
+        if isinstance(pack, FrozenPack):
+            return pack.View(path)
+        self.tick += 1
+        key = _Key(path, pack)
+        entry = self.entries.get(key)
+        if entry:
+            self.hits += 1
+            entry[1] = self.tick
+        else:
+            self.misses += 1
+            size = pack.Size(path) if pack is not None else os.stat(path)[6]
+            self._MakeRoom(size)
+            buf = bytearray(size)
+            if pack is not None:
+                pack.ReadInto(path, buf)
+            else:
+                with open(path, "rb") as f:
+                    f.readinto(buf)
+            if not pin and self.used + size > self.budget:
+                return buf # everything left is pinned; hand it back uncached
+
+            entry = [buf, self.tick, 0]
+            self.entries[key] = entry
+            self.used += size
+        if pin:
+            entry[2] += 1
+        return entry[0]
+
+    def Pin(self, path, pack=None):
+        return self.Load(path, True, pack)
+
+    def Unpin(self, path, pack=None):
+        entry = self.entries.get(_Key(path, pack))
+        if entry and entry[2]:
+            entry[2] -= 1
+            if self.used > self.budget:
+                self._MakeRoom(0)
+
+    def Drop(self, path, pack=None):
+        entry = self.entries.pop(_Key(path, pack), None)
+        if entry:
+            self.used -= len(entry[0])
+
+    def Clear(self):
+        self.entries = {}
+        self.used = 0
+
+    def SetBudget(self, budget):
+        self.budget = budget
+        self._MakeRoom(0)
+
+    def _MakeRoom(self, size):
+        # Evict unpinned assets, oldest first, until size more bytes fit
+        while self.used + size > self.budget:
+            oldest = None
+            oldestTick = 0
+            for key, entry in self.entries.items():
+                if not entry[2] and (oldest is None or entry[1] < oldestTick):
+                    oldest = key
+                    oldestTick = entry[1]
+            if oldest is None:
+                break
+            self.used -= len(self.entries.pop(oldest)[0])
+
+_cache = AssetCache()
+
+def Load(path, pin=False, pack=None):
+    return _cache.Load(path, pin, pack)
+
+def Pin(path, pack=None):
+    return _cache.Pin(path, pack)
+
+def Unpin(path, pack=None):
+    _cache.Unpin(path, pack)
+
+def Drop(path, pack=None):
+    _cache.Drop(path, pack)
+
+def Clear():
+    _cache.Clear()
+
+def SetBudget(budget):
+    _cache.SetBudget(budget)
+
+def Cache():
+    # The shared AssetCache, e.g. for its used/hits/misses counters
+    return _cache
@@ -0,0 +1,97 @@
+import os
+import struct
+from array import array
+
+# Sprite atlases: many named frames in one file, read with a single open and handed out as
+# memoryview slices of the one buffer, so fetching a frame never touches the filesystem or copies.
+# File layout (little-endian):
+#   "AT", frame count (u16)
+#   per frame: name length (u8), name, width (u16), height (u16), offset into the pixels (u32)
+#   a zero byte if needed so the pixels start at an even offset (for ptr16 access)
+#   pixels: every frame's RGB565 pixels in panel (big-endian) order, one after another
+
+HEADER = "<2sH"
+HEADER_SIZE = 4
+ENTRY = "<HHI"
+ENTRY_SIZE = 8
+
+class Atlas:
+    def __init__(self, data):
+        self.data = data
+        view = memoryview(data)
+        magic, count = struct.unpack_from(HEADER, data, 0)
+        if magic != b"AT":
+            raise ValueError("not an atlas")
+
+        self.names = [] # frame index -> name
+        self.frames = {} # name -> index
+        self.pixels = [] # index -> memoryview of the frame's pixels
+        self.sizes = [] # index -> (width, height)
+        self.table = array("I", [0] * (count * 3)) # index -> start (in pixels from data[0]), width, height
+        pos = HEADER_SIZE
+        entries = []
+        for _ in range(count):
+            n = data[pos]
+            name = str(bytes(view[pos + 1:pos + 1 + n]), "utf-8")
+            pos += 1 + n
+            entries.append((name,) + struct.unpack_from(ENTRY, data, pos))
+            pos += ENTRY_SIZE
+
+        pos += pos & 1
+        for name, w, h, offset in entries:
+            start = pos + offset
+            i = len(self.names) * 3
+            self.table[i] = start >> 1
+            self.table[i + 1] = w
+            self.table[i + 2] = h
+            self.frames[name] = len(self.names)
+            self.names.append(name)
+            self.pixels.append(view[start:start + w * h * 2])
+            self.sizes.append((w, h))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.frames
+
+    def __getitem__(self, name):
+        return self.pixels[self.frames[name]]
+
+    def Get(self, name, default=None):
+        i = self.frames.get(name)
+        return default if i is None else self.pixels[i]
+
+    def Index(self, name):
+        return self.frames[name]
+
+    def Frame(self, i):
+        return self.pixels[i]
+
+    def Size(self, name):
+        return self.sizes[self.frames[name]]
+
+def LoadAtlas(path):
+    # One allocation, filled in place
+    data = bytearray(os.stat(path)[6])
+    with open(path, "rb") as f:
+        f.readinto(data)
+    return Atlas(data)
+
+def EncodeAtlas(frames):
+    # [(name, pixels, width, height), ...] -> atlas file bytes
+    index = bytearray(struct.pack(HEADER, b"AT", len(frames)))
+    offset = 0
+    for name, pixels, w, h in frames:
+        if len(pixels) != w * h * 2:
+            raise ValueError("frame " + name + " is the wrong size")
+        encoded = name.encode()
+        index += bytes([len(encoded)]) + encoded + struct.pack(ENTRY, w, h, offset)
+        offset += w * h * 2
+    if len(index) & 1:
+        index.append(0)
+    return bytes(index) + b"".join(bytes(frame[1]) for frame in frames)
+
+def SaveAtlas(path, frames):
+    with open(path, "wb") as f:
+        f.write(EncodeAtlas(frames))
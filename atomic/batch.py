@@ -0,0 +1,98 @@
+import micropython
+from array import array
+
+# Per-sprite flags
+FLIP_X = 1
+FLIP_Y = 2
+OPAQUE = 4 # draw the transparent colour too
+HIDDEN = 8
+
+@micropython.viper
+def _DrawBatch(recs: ptr16, n: int, table: ptr32, src: ptr16, dst: ptr16,
+               dstW: int, dstH: int, ox: int, oy: int, key: int) -> int:
+    # Every record is (x, y, frame, flags); x and y are signed
+    drawn = 0
+    for i in range(n):
+        r = i << 2
+        flags = int(recs[r + 3])
+        if flags & 8:
+            continue
+        x = int(recs[r])
+        if x & 0x8000:
+            x -= 0x10000
+        y = int(recs[r + 1])
+        if y & 0x8000:
+            y -= 0x10000
+        x -= ox
+        y -= oy
+        f = int(recs[r + 2]) * 3
+        base = table[f]
+        w = table[f + 1]
+        h = table[f + 2]
+
+        x0 = x if x > 0 else 0
+        y0 = y if y > 0 else 0
+        x1 = x + w if x + w < dstW else dstW
+        y1 = y + h if y + h < dstH else dstH
+        if x1 <= x0 or y1 <= y0:
+            continue
+
+        for row in range(y0, y1):
+            sy = row - y
+            if flags & 2:
+                sy = h - 1 - sy
+            s = base + sy * w
+            d = row * dstW
+            if flags & 1:
+                s += w - 1 + x
+                for col in range(x0, x1):
+                    c = src[s - col]
+                    if c != key or flags & 4:
+                        dst[d + col] = c
+            else:
+                s -= x
+                for col in range(x0, x1):
+                    c = src[s + col]
+                    if c != key or flags & 4:
+                        dst[d + col] = c
+        drawn += 1
+    return drawn
+
+class SpriteBatch:
+    # Sprite records (x, y, frame, flags) packed into one array, all drawn by a single Viper call
+    # with frames taken from an Atlas
+    def __init__(self, atlas, maxSprites=64):
+        self.atlas = atlas
+        self.records = array("h", [0] * (maxSprites * 4))
+        self.maxSprites = maxSprites
+        self.count = 0
+
+    def Clear(self):
+        self.count = 0
+
+    def Add(self, x, y, frame, flags=0):
+        # frame is a frame name or number; returns the sprite's slot for Set()
+        if self.count >= self.maxSprites:
+            raise IndexError("sprite batch is full")
+        i = self.count
+        self.count += 1
+        self.Set(i, x, y, frame, flags)
+        return i
+
+    def Set(self, i, x, y, frame=None, flags=None):
+        r = i << 2
+        recs = self.records
+        recs[r] = x
+        recs[r + 1] = y
+        if frame is not None:
+            recs[r + 2] = self.atlas.Index(frame) if isinstance(frame, str) else frame
+        if flags is not None:
+            recs[r + 3] = flags
+
+    def Draw(self, dst, dstW, dstH, trans=-1, offsetX=0, offsetY=0):
+        # Draw every sprite into an RGB565 buffer, clipped to it, in the order they were added.
+        # Pixels of colour trans are skipped; offset is the buffer's position, e.g. a strip's y
+        # Returns how many sprites were at least partly inside the buffer
+        key = ((trans & 0xFF) << 8) | ((trans >> 8) & 0xFF) if trans >= 0 else -1
+        return _DrawBatch(self.records, self.count, self.atlas.table, self.atlas.data,
+                          dst, dstW, dstH, offsetX, offsetY, key)
@@ -0,0 +1,198 @@
+from atomic.surface import Surface
+
+MERGE_SLACK = 256 # extra pixels worth pushing to save a separate blit_buffer call
+MAX_RECTS = 16
+
+def _Outside(r, o):
+    # The parts of r not covered by o: the bands above and below it, then either side
+    if r[0] >= o[2] or o[0] >= r[2] or r[1] >= o[3] or o[1] >= r[3]:
+        return (r,)
+    parts = []
+    y0 = r[1] if r[1] > o[1] else o[1]
+    y1 = r[3] if r[3] < o[3] else o[3]
+    if r[1] < o[1]:
+        parts.append([r[0], r[1], r[2], o[1]])
+    if r[3] > o[3]:
+        parts.append([r[0], o[3], r[2], r[3]])
+    if r[0] < o[0]:
+        parts.append([r[0], y0, o[0], y1])
+    if r[2] > o[2]:
+        parts.append([o[2], y0, r[2], y1])
+    return parts
+
+class Compositor:
+    def __init__(self, display, width=240, height=240, stripBytes=4096, x=0, y=0):
+        self.display = display
+        self.w = width # not width/height, which are the driver's methods (see width() below)
+        self.h = height
+        self.x = x
+        self.y = y
+        self.surface = Surface(width, height)
+        self.view = memoryview(self.surface.buf)
+        self.strip = memoryview(bytearray(max(stripBytes, width * 2)))
+        self.rects = [] # damaged areas as [x0, y0, x1, y1], exclusive ends
+
+        self.pushedPixels = 0 # pixels sent by the last Flush()
+        self.pushedRects = 0
+        self.totalPixels = 0
+
+    # Damage tracking
+
+    def Damage(self, x, y, w, h):
+        x0 = x if x > 0 else 0
+        y0 = y if y > 0 else 0
+        x1 = x + w if x + w < self.w else self.w
+        y1 = y + h if y + h < self.h else self.h
+        if x1 <= x0 or y1 <= y0:
+            return
+        self._Add([x0, y0, x1, y1])
+
+    def DamageAll(self):
+        self.rects = [[0, 0, self.w, self.h]]
+
+    def _Add(self, r):
+        # Merge r with a rectangle when their union costs little more than both, otherwise keep
+        # it separate; any overlap that's left is cut out of r so it's only pushed once
+        rects = self.rects
+        merged = True
+        while merged:
+            merged = False
+            area = (r[2] - r[0]) * (r[3] - r[1])
+            for i in range(len(rects)):
+                o = rects[i]
+                ux0 = r[0] if r[0] < o[0] else o[0]
+                uy0 = r[1] if r[1] < o[1] else o[1]
+                ux1 = r[2] if r[2] > o[2] else o[2]
+                uy1 = r[3] if r[3] > o[3] else o[3]
+                if (ux1 - ux0) * (uy1 - uy0) <= area + (o[2] - o[0]) * (o[3] - o[1]) + MERGE_SLACK:
+                    r = [ux0, uy0, ux1, uy1]
+                    rects.pop(i)
+                    merged = True
+                    break
+
+        parts = [r]
+        for o in rects:
+            parts = [q for p in parts for q in _Outside(p, o)]
+        rects.extend(parts)
+
+        while len(rects) > MAX_RECTS:
+            self._MergeCheapestPair()
+
+    def _MergeCheapestPair(self):
+        rects = self.rects
+        best = None
+        bestCost = 0
+        for i in range(len(rects)):
+            a = rects[i]
+            for j in range(i + 1, len(rects)):
+                b = rects[j]
+                u = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                cost = (u[2] - u[0]) * (u[3] - u[1]) - (a[2] - a[0]) * (a[3] - a[1]) - (b[2] - b[0]) * (b[3] - b[1])
+                if best is None or cost < bestCost:
+                    best = (i, j, u)
+                    bestCost = cost
+        i, j, u = best
+        rects.pop(j)
+        rects.pop(i)
+        rects.append(u)
+
+    # Drawing; same calls as the display, each one marks its own area as damaged
+
+    def width(self):
+        return self.w
+
+    def height(self):
+        return self.h
+
+    def fill(self, color):
+        self.surface.fill(color)
+        self.DamageAll()
+
+    def fill_rect(self, x, y, w, h, color):
+        self.surface.fill_rect(x, y, w, h, color)
+        self.Damage(x, y, w, h)
+
+    def rect(self, x, y, w, h, color):
+        self.surface.rect(x, y, w, h, color)
+        self.Damage(x, y, w, h)
+
+    def hline(self, x, y, w, color):
+        self.surface.hline(x, y, w, color)
+        self.Damage(x, y, w, 1)
+
+    def vline(self, x, y, h, color):
+        self.surface.vline(x, y, h, color)
+        self.Damage(x, y, 1, h)
+
+    def line(self, x0, y0, x1, y1, color):
+        self.surface.line(x0, y0, x1, y1, color)
+        self.Damage(min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1)
+
+    def pixel(self, x, y, color):
+        self.surface.pixel(x, y, color)
+        self.Damage(x, y, 1, 1)
+
+    def circle(self, x, y, r, color):
+        self.surface.circle(x, y, r, color)
+        self.Damage(x - r, y - r, 2 * r + 1, 2 * r + 1)
+
+    def fill_circle(self, x, y, r, color):
+        self.surface.fill_circle(x, y, r, color)
+        self.Damage(x - r, y - r, 2 * r + 1, 2 * r + 1)
+
+    def text(self, font, msg, x, y, fg=0xFFFF, bg=0x0000):
+        self.surface.text(font, msg, x, y, fg, bg)
+        self.Damage(x, y, len(msg) * font.WIDTH, font.HEIGHT)
+
+    def blit_buffer(self, buf, x, y, w, h):
+        self.surface.blit_buffer(buf, x, y, w, h)
+        self.Damage(x, y, w, h)
+
+    def blit(self, src, x, y, transparent=-1):
+        self.surface.blit(src, x, y, transparent)
+        if isinstance(src, Surface):
+            self.Damage(x, y, src.width, src.height)
+        else:
+            self.Damage(x, y, src[1], src[2])
+
+    # Output
+
+    def Flush(self):
+        pushed = 0
+        for r in self.rects:
+            pushed += self._Push(r[0], r[1], r[2] - r[0], r[3] - r[1])
+        self.pushedRects = len(self.rects)
+        self.pushedPixels = pushed
+        self.totalPixels += pushed
+        self.rects = []
+        return pushed
+
+    def _Push(self, x, y, w, h):
+        disp = self.display
+        view = self.view
+        rowBytes = self.w << 1
+        ox = self.x
+        oy = self.y
+
+        if w == self.w:
+            # Full-width rows are already contiguous in the shadow buffer
+            start = y * rowBytes
+            disp.blit_buffer(view[start:start + h * rowBytes], ox, oy + y, w, h)
+            return w * h
+
+        # Otherwise gather rows into the strip buffer, as many as fit per blit
+        strip = self.strip
+        n = w << 1
+        rowsPerStrip = len(strip) // n
+        row = 0
+        while row < h:
+            rows = h - row if h - row < rowsPerStrip else rowsPerStrip
+            src = (y + row) * rowBytes + (x << 1)
+            dst = 0
+            for _ in range(rows):
+                strip[dst:dst + n] = view[src:src + n]
+                src += rowBytes
+                dst += n
+            disp.blit_buffer(strip[:rows * n], ox + x, oy + y + row, w, rows)
+            row += rows
+        return w * h
@@ -0,0 +1,115 @@
+import sys
+from atomic.compositor import Compositor
+
+_proxies = []
+_saved = {}
+
+# Driver calls that draw in ways the shadow can't copy (fonts, images, polygons) or change how the
+# panel maps what it's sent. The shadow can't follow them, so the proxy stops using it
+_UNMIRRORED = ("bitmap", "pbitmap", "write", "draw", "polygon", "fill_polygon", "jpg", "png",
+               "rotation", "offset", "madctl", "vscsad")
+
+# Calls the shadow normally takes; once the proxy is passing straight through, they go to the display
+_MIRRORED = ("fill", "fill_rect", "rect", "hline", "vline", "line", "pixel", "circle",
+             "fill_circle", "text", "blit_buffer")
+
+class DisplayProxy(Compositor):
+    # Wraps an st7789.ST7789 so its drawing calls land in a RAM shadow and go out
+    # as merged regions on Flush(); anything that isn't drawing is passed straight through
+    def __init__(self, display, stripBytes=4096):
+        try:
+            width = display.width()
+            height = display.height()
+        except Exception:
+            width = height = 240
+        Compositor.__init__(self, display, width, height, stripBytes)
+        self.direct = False # True once a call the shadow can't follow has been made
+
+    def __getattr__(self, name):
+        attr = getattr(self.display, name)
+        if name in _UNMIRRORED and not self.direct:
+            self.Direct()
+        return attr
+
+    def Direct(self):
+        # Send what's pending, then pass every call straight to the display from now on. Flushing
+        # first isn't enough on its own: a later merged region could push stale shadow pixels
+        # over whatever the unmirrored call drew
+        self.Flush()
+        self.direct = True
+        for name in _MIRRORED:
+            setattr(self, name, getattr(self.display, name))
+
+    def blit(self, src, x, y, transparent=-1):
+        # Not a driver call, but a proxy is a Compositor too
+        if not self.direct:
+            Compositor.blit(self, src, x, y, transparent)
+            return
+        if transparent >= 0:
+            raise ValueError("the panel can't be read back for a transparent blit")
+        if isinstance(src, tuple):
+            self.display.blit_buffer(src[0], x, y, src[1], src[2])
+        else:
+            src.Flush(self.display, x, y)
+
+def FlushAll():
+    for proxy in _proxies:
+        proxy.Flush()
+
+class _Module:
+    pass
+
+def _Copy(module):
+    shim = _Module()
+    for name in dir(module):
+        if not name.startswith("__"):
+            setattr(shim, name, getattr(module, name))
+    return shim
+
+def Install():
+    # Makes "import st7789" hand out proxied displays and "time.sleep*" flush them first,
+    # so an unmodified game gets batched drawing with one flush per frame
+    import st7789
+    import time
+
+    if _saved:
+        return
+
+    def ST7789(*args, **kwargs):
+        proxy = DisplayProxy(st7789.ST7789(*args, **kwargs))
+        _proxies.append(proxy)
+        return proxy
+
+    def sleep(s):
+        FlushAll()
+        time.sleep(s)
+
+    def sleep_ms(ms):
+        FlushAll()
+        time.sleep_ms(ms)
+
+    def sleep_us(us):
+        FlushAll()
+        time.sleep_us(us)
+
+    stShim = _Copy(st7789)
+    stShim.ST7789 = ST7789
+
+    timeShim = _Copy(time)
+    timeShim.sleep = sleep
+    timeShim.sleep_ms = sleep_ms
+    timeShim.sleep_us = sleep_us
+
+    for name, shim in (("st7789", stShim), ("time", timeShim), ("utime", timeShim)):
+        _saved[name] = sys.modules.get(name)
+        sys.modules[name] = shim
+
+def Uninstall():
+    FlushAll()
+    for name, old in _saved.items():
+        if old is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = old
+    _saved.clear()
+    _proxies.clear()
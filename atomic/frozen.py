@@ -0,0 +1,60 @@
+from atomic.pack import FormatFor
+
+# Assets frozen into the firmware as bytes constants. Frozen bytes stay in flash and are read in
+# place, so a frozen asset costs no heap and no load time. FreezeAssets() writes the module (on
+# the host, see tools/freeze.py); it's then frozen into the firmware with mpy-cross/manifest.py
+
+class FrozenPack:
+    # A frozen asset module behind the same calls as a Pack, plus View() for zero-copy access
+    def __init__(self, module):
+        self.path = module.__name__
+        self.assets = module.ASSETS
+        self.formats = module.FORMATS
+
+    def __contains__(self, name):
+        return name in self.assets
+
+    def Names(self):
+        return list(self.assets)
+
+    def Size(self, name):
+        return len(self.assets[name])
+
+    def Format(self, name):
+        return self.formats[name]
+
+    def View(self, name):
+        return memoryview(self.assets[name])
+
+    def ReadInto(self, name, buf):
+        data = self.assets[name]
+        if len(buf) < len(data):
+            raise ValueError("buffer too small for " + name)
+        buf[:len(data)] = data
+        return len(data)
+
+    def Read(self, name):
+        # A RAM copy, for when the asset needs changing; use View() otherwise
+        return bytearray(self.assets[name])
+
+    def Close(self):
+        pass
+
+def FreezeAssets(path, files, lineBytes=64):
+    # files: [(name, data), ...] or [(name, data, format), ...], as for SavePack
+    with open(path, "w") as f:
+        f.write("# Auto-generated by atomic.frozen - freeze into the firmware, don't copy to the board\n")
+        f.write("FORMATS = {\n")
+        for entry in files:
+            fmt = entry[2] if len(entry) > 2 else FormatFor(entry[0])
+            f.write(f"    {entry[0]!r}: {fmt},\n")
+        f.write("}\n\nASSETS = {\n")
+        for entry in files:
+            data = bytes(entry[1])
+            f.write(f"    {entry[0]!r}: (\n")
+            for i in range(0, len(data), lineBytes):
+                f.write(f"        {data[i:i + lineBytes]!r}\n")
+            if not data:
+                f.write("        b''\n")
+            f.write("    ),\n")
+        f.write("}\n")
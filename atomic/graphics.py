@@ -1,4 +1,5 @@
 import micropython
+from array import array
 
 @micropython.viper
 def BlitTileToBuffer(tile: ptr16, buf: ptr16,
@@ -24,6 +25,36 @@ def BlendRGB565(a: int, b: int, w8: int) -> int:
     b_ = (((a      ) & 0x1F) * inv + ((b      ) & 0x1F) * w8) >> 8
     return (r << 11) | (g << 5) | b_
 
+def BlendLUT(color: int, weight: float, lut=None):
+    # Per-channel tables for blending any colour towards color, using the same 8-bit expanded,
+    # float-weighted maths as a per-pixel blend (so results match it exactly): r in 0-31, g in 32-95, b in 96-127
+    if lut is None:
+        lut = array("H", [0] * 128)
+    r2 = int(((color >> 11) & 0x1F) * 255 / 31)
+    g2 = int(((color >> 5) & 0x3F) * 255 / 63)
+    b2 = int((color & 0x1F) * 255 / 31)
+    w = weight
+    for i in range(32):
+        r = int(int(i * 255 / 31) * (1 - w) + r2 * w)
+        b = int(int(i * 255 / 31) * (1 - w) + b2 * w)
+        lut[i] = (r & 0xF8) << 8
+        lut[96 + i] = b >> 3
+    for i in range(64):
+        g = int(int(i * 255 / 63) * (1 - w) + g2 * w)
+        lut[32 + i] = (g & 0xFC) << 3
+    return lut
+
+@micropython.viper
+def BlendBuffer(buf: ptr16, n: int, lut: ptr16, trans: int = -1):
+    # Blends n big-endian RGB565 pixels in place through a BlendLUT, leaving the trans colour alone
+    for i in range(n):
+        c = buf[i]
+        c = ((c & 0xFF) << 8) | ((c >> 8) & 0xFF)
+        if c == trans:
+            continue
+        c = lut[(c >> 11) & 0x1F] | lut[32 + ((c >> 5) & 0x3F)] | lut[96 + (c & 0x1F)]
+        buf[i] = ((c & 0xFF) << 8) | ((c >> 8) & 0xFF)
+
 @micropython.viper
 def BlitTransparentSprite(tile: ptr16, buf: ptr16,
                           screenW: int, x: int, y: int,
@@ -51,11 +82,15 @@ def HEXto565(h: str) -> int:
 
 @micropython.viper
 def ScaleSprite(src: ptr8, dst: ptr8,
-                   srcW: int, srcH: int, scale: int):
+                   srcW: int, srcH: int, scale: int,
+                   flip: int = 0, trans: int = -1):
     if scale <= 0:
         return
 
     dstW = srcW * scale
+    keyed = trans >= 0
+    t0 = (trans >> 8) & 0xFF
+    t1 = trans & 0xFF
 
     for y in range(srcH):
         srcRowBase = (y * srcW) << 1
@@ -64,12 +99,120 @@ def ScaleSprite(src: ptr8, dst: ptr8,
             dstRowBase = ((y * scale + ry) * dstW) << 1
 
             for x in range(srcW):
-                srcI = srcRowBase + (x << 1)
+                sx = srcW - 1 - x if flip else x
+                srcI = srcRowBase + (sx << 1)
                 b0 = src[srcI]
                 b1 = src[srcI + 1]
+                if keyed and b0 == t0 and b1 == t1:
+                    continue
 
                 dstI = dstRowBase + ((x * scale) << 1)
                 for rx in range(scale):
                     di = dstI + (rx << 1)
                     dst[di] = b0
                     dst[di + 1] = b1
+
+@micropython.viper
+def _BlitKeyed(src: ptr16, srcI: int, srcStride: int,
+               dst: ptr16, dstI: int, dstStride: int,
+               w: int, h: int, key: int):
+    for row in range(h):
+        s = srcI + row * srcStride
+        d = dstI + row * dstStride
+        for col in range(w):
+            c = src[s + col]
+            if c != key:
+                dst[d + col] = c
+
+@micropython.native
+def BlitRect(src, srcW: int, srcH: int, dst, dstW: int, dstH: int,
+             x: int, y: int, trans: int = -1, srcStride: int = 0, clip=None):
+    if srcStride <= 0:
+        srcStride = srcW
+    if clip:
+        cx0, cy0 = clip[0], clip[1]
+        cx1, cy1 = cx0 + clip[2], cy0 + clip[3]
+        if cx0 < 0: cx0 = 0
+        if cy0 < 0: cy0 = 0
+        if cx1 > dstW: cx1 = dstW
+        if cy1 > dstH: cy1 = dstH
+    else:
+        cx0, cy0, cx1, cy1 = 0, 0, dstW, dstH
+
+    x0 = x if x > cx0 else cx0
+    y0 = y if y > cy0 else cy0
+    x1 = x + srcW if x + srcW < cx1 else cx1
+    y1 = y + srcH if y + srcH < cy1 else cy1
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    if trans >= 0:
+        # Pixels are big-endian in memory, so compare against the key as it reads through a ptr16
+        key = ((trans & 0xFF) << 8) | ((trans >> 8) & 0xFF)
+        _BlitKeyed(src, (y0 - y) * srcStride + (x0 - x), srcStride,
+                   dst, y0 * dstW + x0, dstW, x1 - x0, y1 - y0, key)
+        return
+
+    # Opaque rows are contiguous runs, so copy each one with a single slice assignment
+    sv = memoryview(src)
+    dv = memoryview(dst)
+    n = (x1 - x0) << 1
+    s = ((y0 - y) * srcStride + (x0 - x)) << 1
+    d = (y0 * dstW + x0) << 1
+    sStep = srcStride << 1
+    dStep = dstW << 1
+    for _ in range(y1 - y0):
+        dv[d:d + n] = sv[s:s + n]
+        s += sStep
+        d += dStep
+
+@micropython.native
+def CompileSpans(src, w: int, h: int, trans: int):
+    # Turns a sprite into runs of opaque pixels: a u16 span count, then (row, x, length) per span,
+    # a pad byte if needed so the pixels start on an even offset, then only the opaque pixels
+    if w > 255 or h > 255:
+        raise ValueError("sprite too large to compile")
+    spans = bytearray()
+    pixels = bytearray()
+    for y in range(h):
+        row = y * w
+        x = 0
+        while x < w:
+            i = (row + x) << 1
+            if ((src[i] << 8) | src[i + 1]) == trans:
+                x += 1
+                continue
+            start = x
+            while x < w:
+                i = (row + x) << 1
+                if ((src[i] << 8) | src[i + 1]) == trans:
+                    break
+                x += 1
+            spans.extend(bytes((y, start, x - start)))
+            pixels.extend(src[(row + start) << 1:(row + x) << 1])
+    n = len(spans) // 3
+    if n & 1:
+        spans.append(0)
+    return bytes((n & 0xFF, n >> 8)) + spans + pixels
+
+@micropython.viper
+def BlitSpans(spans: ptr8, dst: ptr8, dstW: int, dstH: int, x: int, y: int):
+    # Pixels start on an even offset (see CompileSpans), so each run is copied a pixel at a time
+    spans16 = ptr16(spans)
+    dst16 = ptr16(dst)
+    n = spans[0] | (spans[1] << 8)
+    s = 2
+    p = (2 + n * 3 + 1) >> 1 # in pixels
+    for _ in range(n):
+        py = y + spans[s]
+        px = x + spans[s + 1]
+        length = spans[s + 2]
+        s += 3
+        if py >= 0 and py < dstH:
+            a = px if px > 0 else 0
+            b = px + length if px + length < dstW else dstW
+            src = p + a - px
+            d = py * dstW + a
+            for k in range(b - a):
+                dst16[d + k] = spans16[src + k]
+        p += length
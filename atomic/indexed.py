@@ -0,0 +1,129 @@
+import micropython
+import struct
+
+# Indexed-colour images: 4 or 8 bits per pixel looked up in a 16/256-entry RGB565 palette.
+# File layout (little-endian header):
+#   "IX", bpp (u8), transparent index (u8, 255 = none), width (u16), height (u16), colours (u16)
+#   palette: colours x RGB565 in panel (big-endian) order
+#   pixels: rows of width pixels, 4bpp rows padded to a whole byte, high nibble first
+
+HEADER = "<2sBBHHH"
+HEADER_SIZE = 10
+NO_TRANS = 255
+
+@micropython.viper
+def _Blit4(src: ptr8, srcI: int, rowBytes: int, sx: int, pal: ptr16,
+           dst: ptr16, dstI: int, dstStride: int, w: int, h: int, trans: int):
+    for row in range(h):
+        s = srcI + row * rowBytes
+        d = dstI + row * dstStride
+        for col in range(w):
+            p = sx + col
+            b = src[s + (p >> 1)]
+            i = (b & 0x0F) if p & 1 else (b >> 4)
+            if i != trans:
+                dst[d + col] = pal[i]
+
+@micropython.viper
+def _Blit8(src: ptr8, srcI: int, rowBytes: int, sx: int, pal: ptr16,
+           dst: ptr16, dstI: int, dstStride: int, w: int, h: int, trans: int):
+    for row in range(h):
+        s = srcI + row * rowBytes + sx
+        d = dstI + row * dstStride
+        for col in range(w):
+            i = src[s + col]
+            if i != trans:
+                dst[d + col] = pal[i]
+
+def MakePalette(colors):
+    # List of RGB565 colours -> palette buffer in panel byte order
+    pal = bytearray(len(colors) * 2)
+    for i in range(len(colors)):
+        pal[2 * i] = colors[i] >> 8
+        pal[2 * i + 1] = colors[i] & 0xFF
+    return pal
+
+class IndexedImage:
+    def __init__(self, width, height, bpp, palette, data, trans=-1):
+        self.width = width
+        self.height = height
+        self.bpp = bpp
+        self.palette = palette # swap this (or pass one to Blit) to recolour for free
+        self.data = data
+        self.trans = trans # palette index, or -1
+        self.rowBytes = (width + 1) >> 1 if bpp == 4 else width
+
+    def Blit(self, dst, dstW, dstH, x, y, palette=None, opaque=False):
+        # Expand into an RGB565 buffer, clipped to it; the transparent index is skipped unless opaque
+        x0 = x if x > 0 else 0
+        y0 = y if y > 0 else 0
+        x1 = x + self.width if x + self.width < dstW else dstW
+        y1 = y + self.height if y + self.height < dstH else dstH
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        blit = _Blit4 if self.bpp == 4 else _Blit8
+        blit(self.data, (y0 - y) * self.rowBytes, self.rowBytes, x0 - x,
+             palette if palette is not None else self.palette,
+             dst, y0 * dstW + x0, dstW, x1 - x0, y1 - y0, -1 if opaque else self.trans)
+
+    def Expand(self, buf=None, palette=None):
+        # Whole image as plain RGB565 (e.g. for display.blit_buffer)
+        if buf is None:
+            buf = bytearray(self.width * self.height * 2)
+        self.Blit(buf, self.width, self.height, 0, 0, palette, True)
+        return buf
+
+    def Save(self, path):
+        with open(path, "wb") as f:
+            f.write(struct.pack(HEADER, b"IX", self.bpp, NO_TRANS if self.trans < 0 else self.trans,
+                                self.width, self.height, len(self.palette) // 2))
+            f.write(self.palette)
+            f.write(self.data)
+
+def Load(path):
+    with open(path, "rb") as f:
+        magic, bpp, trans, width, height, colors = struct.unpack(HEADER, f.read(HEADER_SIZE))
+        if magic != b"IX" or bpp not in (4, 8):
+            raise ValueError("not an indexed image: " + path)
+        palette = bytearray(f.read(colors * 2))
+        data = bytearray(f.read())
+    return IndexedImage(width, height, bpp, palette, data, -1 if trans == NO_TRANS else trans)
+
+def Encode(pixels, width, height, bpp=0, trans=-1):
+    # Convert panel-order RGB565 pixels (e.g. a .tile) to an IndexedImage; trans is an RGB565
+    # colour to make transparent. bpp=0 picks 4 when there are 16 colours or fewer
+    colors = []
+    lookup = {}
+    if trans >= 0:
+        colors.append(trans)
+        lookup[trans] = 0
+    indices = bytearray(width * height)
+    for i in range(width * height):
+        c = (pixels[2 * i] << 8) | pixels[2 * i + 1]
+        index = lookup.get(c)
+        if index is None:
+            index = len(colors)
+            if index > 255:
+                raise ValueError("more than 256 colours")
+            lookup[c] = index
+            colors.append(c)
+        indices[i] = index
+
+    if not bpp:
+        bpp = 4 if len(colors) <= 16 else 8
+    elif len(colors) > (1 << bpp):
+        raise ValueError(f"{len(colors)} colours don't fit in {bpp}bpp")
+
+    if bpp == 4:
+        rowBytes = (width + 1) >> 1
+        data = bytearray(rowBytes * height)
+        for y in range(height):
+            for x in range(width):
+                index = indices[y * width + x]
+                j = y * rowBytes + (x >> 1)
+                data[j] |= index if x & 1 else index << 4
+    else:
+        data = indices
+
+    return IndexedImage(width, height, bpp, MakePalette(colors), data, 0 if trans >= 0 else -1)
@@ -0,0 +1,95 @@
+import struct
+
+# Asset packs: a game's assets concatenated into one file behind a name index, so loading them
+# costs one open plus a seek per asset instead of a directory walk and an open per file.
+# File layout (little-endian):
+#   "PK", entry count (u16)
+#   per entry: name length (u8), name, format (u8), offset into the data (u32), length (u32)
+#   data: every asset's bytes, one after another
+
+HEADER = "<2sH"
+HEADER_SIZE = 4
+ENTRY = "<BII"
+ENTRY_SIZE = 9
+
+# Formats, so a reader can tell what an entry holds without trusting its name
+RAW     = 0
+TEXT    = 1
+TILE    = 2
+ATLAS   = 3
+TILEMAP = 4
+INDEXED = 5
+
+EXTENSIONS = {".txt": TEXT, ".info": TEXT, ".wld": TEXT, ".tile": TILE,
+              ".atl": ATLAS, ".tm": TILEMAP, ".ix": INDEXED}
+
+def FormatFor(name):
+    dot = name.rfind(".")
+    return EXTENSIONS.get(name[dot:], RAW) if dot >= 0 else RAW
+
+class Pack:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb") # kept open; every read is a seek into it
+        magic, count = struct.unpack(HEADER, self.file.read(HEADER_SIZE))
+        if magic != b"PK":
+            self.file.close()
+            raise ValueError("not an asset pack: " + path)
+
+        self.entries = {} # name -> (absolute offset, length, format)
+        pos = HEADER_SIZE
+        entries = []
+        for _ in range(count):
+            n = self.file.read(1)[0]
+            name = str(self.file.read(n), "utf-8")
+            fmt, offset, length = struct.unpack(ENTRY, self.file.read(ENTRY_SIZE))
+            pos += 1 + n + ENTRY_SIZE
+            entries.append((name, offset, length, fmt))
+        base = pos # data starts straight after the index
+        for name, offset, length, fmt in entries:
+            self.entries[name] = (base + offset, length, fmt)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def Names(self):
+        return list(self.entries)
+
+    def Size(self, name):
+        return self.entries[name][1]
+
+    def Format(self, name):
+        return self.entries[name][2]
+
+    def ReadInto(self, name, buf):
+        # Fill the start of buf with the asset, without allocating; returns the bytes read
+        offset, length, fmt = self.entries[name]
+        if len(buf) < length:
+            raise ValueError("buffer too small for " + name)
+        self.file.seek(offset)
+        return self.file.readinto(memoryview(buf)[:length])
+
+    def Read(self, name):
+        buf = bytearray(self.entries[name][1])
+        self.ReadInto(name, buf)
+        return buf
+
+    def Close(self):
+        self.file.close()
+
+def SavePack(path, files):
+    # files: [(name, data), ...] or [(name, data, format), ...]; format defaults to FormatFor(name)
+    index = bytearray(struct.pack(HEADER, b"PK", len(files)))
+    offset = 0
+    for entry in files:
+        name, data = entry[0], entry[1]
+        fmt = entry[2] if len(entry) > 2 else FormatFor(name)
+        encoded = name.encode()
+        if len(encoded) > 255:
+            raise ValueError("name too long: " + name)
+        index += bytes([len(encoded)]) + encoded + struct.pack(ENTRY, fmt, offset, len(data))
+        offset += len(data)
+    with open(path, "wb") as f:
+        f.write(index)
+        for entry in files:
+            f.write(entry[1])
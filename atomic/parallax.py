@@ -0,0 +1,110 @@
+from atomic.graphics import BlitRect
+from atomic.surface import Surface
+from atomic.viewport import RenderTiles
+
+# Background layers that scroll at their own rate. Parallax composites every layer into one
+# strip buffer, back to front, before sending it, so each pixel crosses the SPI bus once per frame
+# however many layers it's made of. Layers only need a Render(buf, bufW, bufH, stripY, camX, camY)
+# method that draws screen rows stripY onwards into buf
+
+class Layer:
+    # A band of image, repeated sideways, rate times as far as the camera moves. Rate 0 never
+    # scrolls (a sky); rates between 0 and 1 feel distant, above 1 feel close
+    def __init__(self, buf, width, height, rate=1.0, y=0, rateY=0, trans=-1):
+        self.buf = buf
+        self.width = width
+        self.height = height
+        self.rate = rate
+        self.rateY = rateY
+        self.y = y
+        self.trans = trans
+
+    def Render(self, buf, bufW, bufH, stripY, camX, camY):
+        top = self.y - int(camY * self.rateY) - stripY # layer's top row within the strip
+        r0 = top if top > 0 else 0
+        r1 = top + self.height
+        r1 = r1 if r1 < bufH else bufH
+        if r1 <= r0:
+            return
+        w = self.width
+        src = memoryview(self.buf)[(r0 - top) * w * 2:]
+        x = -(int(camX * self.rate) % w)
+        while x < bufW:
+            BlitRect(src, w, r1 - r0, buf, bufW, bufH, x, r0, self.trans)
+            x += w
+
+class TileLayer:
+    # A tilemap as a layer. Static layers are rendered once into a cached image that repeats
+    # sideways like a Layer, which is far cheaper per frame if the map doesn't change; the cache
+    # is the map's full size in pixels, so keep static maps small
+    def __init__(self, tilemap, tileset, tileSize=16, rate=1.0, y=0, rateY=0, trans=-1, static=False):
+        self.tilemap = tilemap
+        self.tileset = tileset
+        self.tileSize = tileSize
+        self.rate = rate
+        self.rateY = rateY
+        self.y = y
+        self.trans = trans
+        self.cache = None
+        if static:
+            self.Refresh()
+
+    def Refresh(self):
+        # Re-render the cached image after changing a static layer's map
+        w = len(self.tilemap[0]) * self.tileSize
+        h = len(self.tilemap) * self.tileSize
+        image = Surface(w, h, self.cache.buf if self.cache else None)
+        image.fill(self.trans if self.trans >= 0 else 0x0000)
+        RenderTiles(image.buf, w, h, self.tilemap, self.tileset, 0, 0, self.tileSize)
+        self.cache = Layer(image.buf, w, h, self.rate, self.y, self.rateY, self.trans)
+
+    def Render(self, buf, bufW, bufH, stripY, camX, camY):
+        if self.cache:
+            self.cache.Render(buf, bufW, bufH, stripY, camX, camY)
+            return
+        RenderTiles(buf, bufW, bufH, self.tilemap, self.tileset, int(camX * self.rate),
+                    stripY - self.y + int(camY * self.rateY), self.tileSize, None, self.trans)
+
+class Parallax:
+    def __init__(self, display, width=240, height=240, rows=16, x=0, y=0, background=0x0000):
+        self.display = display
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.background = background
+        self.strip = Surface(width, rows)
+        self.layers = [] # back to front
+        self.camX = 0
+        self.camY = 0
+
+    def Add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def MoveTo(self, camX, camY):
+        self.camX = camX
+        self.camY = camY
+
+    def Move(self, dx, dy):
+        self.camX += dx
+        self.camY += dy
+
+    def Render(self, strip, y):
+        # Composite the screen rows starting at y into strip; the same signature as the
+        # transitions' render callbacks
+        strip.fill(self.background)
+        for layer in self.layers:
+            layer.Render(strip.buf, strip.width, strip.height, y, self.camX, self.camY)
+
+    def Draw(self, overlay=None):
+        # Send a whole frame; overlay(strip, y) can draw sprites over each strip before it goes out
+        strip = self.strip
+        rows = strip.height
+        width = self.width
+        for y in range(0, self.height, rows):
+            h = rows if y + rows <= self.height else self.height - y
+            self.Render(strip, y)
+            if overlay:
+                overlay(strip, y)
+            self.display.blit_buffer(memoryview(strip.buf)[:width * h * 2], self.x, self.y + y, width, h)
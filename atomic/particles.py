@@ -0,0 +1,181 @@
+import micropython
+from array import array
+from math import cos, sin
+
+# Particles kept as parallel arrays (structure of arrays) with a fixed capacity, so emitting,
+# updating and drawing them allocates nothing. Positions and velocities are fixed point in
+# 1/16ths of a pixel (gravity in 1/256ths); colours are stored in panel byte order, ready to write
+# into a buffer
+
+FRACTION = 16
+
+@micropython.viper
+def _Update(x: ptr16, y: ptr16, vx: ptr16, vy: ptr16, life: ptr16, color: ptr16, n: int,
+            gravity: int, phase: int, steps: int, left: int, top: int, right: int, bottom: int) -> int:
+    # Moves every particle on by steps frames and removes the ones that have died or left the area
+    # (left <= x < right, top <= y < bottom, in 1/16ths), by moving the last particle into their
+    # place; returns how many are left. gravity is in 1/256ths and phase is the remainder carried
+    # over from earlier frames, so fractions of a 1/16th add up instead of being lost
+    i = 0
+    while i < n:
+        remaining = int(life[i]) - steps
+        px = int(x[i])
+        if px & 0x8000:
+            px -= 0x10000
+        py = int(y[i])
+        if py & 0x8000:
+            py -= 0x10000
+        dx = int(vx[i])
+        if dx & 0x8000:
+            dx -= 0x10000
+        dy = int(vy[i])
+        if dy & 0x8000:
+            dy -= 0x10000
+        if remaining > 0:
+            g = phase
+            for _ in range(steps):
+                g += gravity
+                dy += g >> 4
+                g &= 15
+                px += dx
+                py += dy
+        if remaining <= 0 or px < left or px >= right or py < top or py >= bottom:
+            n -= 1
+            x[i] = x[n]
+            y[i] = y[n]
+            vx[i] = vx[n]
+            vy[i] = vy[n]
+            life[i] = life[n]
+            color[i] = color[n]
+            continue
+        life[i] = remaining
+        x[i] = px
+        y[i] = py
+        vy[i] = dy
+        i += 1
+    return n
+
+@micropython.viper
+def _Draw(x: ptr16, y: ptr16, color: ptr16, n: int, dst: ptr16, dstW: int, dstH: int,
+          ox: int, oy: int, size: int, fill: int, bounds: ptr16) -> int:
+    # Also records the area drawn over in bounds as (x0, y0, x1, y1); fill >= 0 overrides colours
+    drawn = 0
+    bx0 = dstW
+    by0 = dstH
+    bx1 = 0
+    by1 = 0
+    for i in range(n):
+        px = int(x[i])
+        if px & 0x8000:
+            px -= 0x10000
+        py = int(y[i])
+        if py & 0x8000:
+            py -= 0x10000
+        px = (px >> 4) - ox
+        py = (py >> 4) - oy
+        x0 = px if px > 0 else 0
+        y0 = py if py > 0 else 0
+        x1 = px + size if px + size < dstW else dstW
+        y1 = py + size if py + size < dstH else dstH
+        if x1 <= x0 or y1 <= y0:
+            continue
+        c = fill if fill >= 0 else int(color[i])
+        for row in range(y0, y1):
+            d = row * dstW
+            for col in range(x0, x1):
+                dst[d + col] = c
+        if x0 < bx0:
+            bx0 = x0
+        if y0 < by0:
+            by0 = y0
+        if x1 > bx1:
+            bx1 = x1
+        if y1 > by1:
+            by1 = y1
+        drawn += 1
+    bounds[0] = bx0
+    bounds[1] = by0
+    bounds[2] = bx1
+    bounds[3] = by1
+    return drawn
+
+class Particles:
+    def __init__(self, maxParticles=256, gravity=0, size=1, area=(0, 0, 240, 240)):
+        self.x = array("h", [0] * maxParticles)
+        self.y = array("h", [0] * maxParticles)
+        self.vx = array("h", [0] * maxParticles)
+        self.vy = array("h", [0] * maxParticles)
+        self.life = array("h", [0] * maxParticles) # frames left
+        self.color = array("H", [0] * maxParticles)
+        self.maxParticles = maxParticles
+        self.count = 0
+        self.gravity = gravity # pixels per frame per frame
+        self.size = size # pixels square
+        self.area = area # (x0, y0, x1, y1) in pixels; particles that leave it are removed
+        self.phase = 0 # gravity carried over between frames, in 1/256ths of a pixel
+        self.seed = 0x2545F491 # own random numbers, so effects don't disturb the game's
+        self.bounds = array("h", [0] * 4) # area covered by the last Draw(), as x0, y0, x1, y1
+
+    def Emit(self, x, y, vx, vy, life, color):
+        # One particle at pixel (x, y), moving (vx, vy) pixels per frame for life frames;
+        # returns False if there's no room
+        i = self.count
+        if i >= self.maxParticles:
+            return False
+        self.x[i] = int(x * FRACTION)
+        self.y[i] = int(y * FRACTION)
+        self.vx[i] = int(vx * FRACTION)
+        self.vy[i] = int(vy * FRACTION)
+        self.life[i] = life
+        self.color[i] = ((color & 0xFF) << 8) | (color >> 8)
+        self.count = i + 1
+        return True
+
+    def _Random(self):
+        # xorshift32, 0 <= result < 1
+        s = self.seed
+        s ^= (s << 13) & 0xFFFFFFFF
+        s ^= s >> 17
+        s ^= (s << 5) & 0xFFFFFFFF
+        self.seed = s
+        return s / 4294967296
+
+    def Burst(self, x, y, n, speed, life, colors, upward=0):
+        # n particles flying out from (x, y) in every direction at up to speed pixels per frame,
+        # each living for life frames give or take a quarter, in colours picked from colors
+        for _ in range(n):
+            angle = self._Random() * 6.2832
+            v = speed * (0.25 + 0.75 * self._Random())
+            span = life * (0.75 + 0.5 * self._Random())
+            color = colors[int(self._Random() * len(colors))]
+            if not self.Emit(x, y, v * cos(angle), v * sin(angle) - upward, int(span), color):
+                return
+
+    def Update(self, frames=1):
+        # Returns how many particles are still alive
+        x0, y0, x1, y1 = self.area
+        size = self.size
+        gravity = int(round(self.gravity * 256))
+        # a particle above the area is only removed if gravity won't bring it back
+        top = (y0 - size + 1) * FRACTION if gravity <= 0 else -0x8000
+        self.count = _Update(self.x, self.y, self.vx, self.vy, self.life, self.color, self.count,
+                             gravity, self.phase, frames, (x0 - size + 1) * FRACTION, top,
+                             x1 * FRACTION, y1 * FRACTION)
+        self.phase = (self.phase + gravity * frames) & 15
+        return self.count
+
+    def Draw(self, dst, dstW, dstH, offsetX=0, offsetY=0, color=-1):
+        # Rasterise every particle into an RGB565 buffer, clipped to it; offset is the buffer's
+        # position on screen. A color draws them all in it, e.g. the background to erase them.
+        # Returns how many were inside the buffer
+        fill = ((color & 0xFF) << 8) | (color >> 8) if color >= 0 else -1
+        return _Draw(self.x, self.y, self.color, self.count, dst, dstW, dstH,
+                     offsetX, offsetY, self.size, fill, self.bounds)
+
+    def Bounds(self):
+        # (x, y, w, h) of the buffer area the last Draw() covered, e.g. for Compositor.Damage()
+        b = self.bounds
+        return b[0], b[1], b[2] - b[0], b[3] - b[1]
+
+    def Clear(self):
+        self.count = 0
@@ -0,0 +1,77 @@
+from atomic.graphics import BlendRGB565, ScaleSprite
+
+class SpriteCache:
+    # Keeps derived sprite buffers (scaled, flipped, tinted...) under a fixed byte budget,
+    # evicting the least recently used ones first
+    def __init__(self, budget=32768):
+        self.budget = budget
+        self.used = 0
+        self.entries = {} # key -> [buf, lastUse]
+        self.tick = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def Get(self, key, build=None):
+        entry = self.entries.get(key)
+        if entry:
+            self.tick += 1
+            entry[1] = self.tick
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        if build is None:
+            return None
+        return self.Put(key, build())
+
+    def Put(self, key, buf):
+        size = len(buf)
+        self.Drop(key)
+        if size > self.budget:
+            return buf # too big to keep; hand it back uncached
+
+        while self.used + size > self.budget:
+            self._EvictOldest()
+
+        self.tick += 1
+        self.entries[key] = [buf, self.tick]
+        self.used += size
+        return buf
+
+    def Drop(self, key):
+        entry = self.entries.pop(key, None)
+        if entry:
+            self.used -= len(entry[0])
+
+    def Clear(self):
+        self.entries = {}
+        self.used = 0
+
+    def _EvictOldest(self):
+        oldest = None
+        oldestTick = 0
+        for key, entry in self.entries.items():
+            if oldest is None or entry[1] < oldestTick:
+                oldest = key
+                oldestTick = entry[1]
+        self.Drop(oldest)
+
+    def Scaled(self, src, w, h, scale=1, flip=False, tint=-1, weight=128, trans=-1):
+        # Scaled/mirrored copy of an RGB565 sprite, optionally blended towards tint (weight 0-255)
+        # apart from pixels of colour trans; keyed on the source buffer, which must stay alive
+        key = (id(src), w, h, scale, flip, tint, weight, trans)
+        return self.Get(key, lambda: _Scale(src, w, h, scale, flip, tint, weight, trans))
+
+def _Scale(src, w, h, scale=1, flip=False, tint=-1, weight=128, trans=-1):
+    if tint >= 0:
+        tinted = bytearray(src)
+        for i in range(0, w * h * 2, 2):
+            c = (tinted[i] << 8) | tinted[i + 1]
+            if c != trans:
+                c = BlendRGB565(c, tint, weight)
+                tinted[i] = c >> 8
+                tinted[i + 1] = c & 0xFF
+        src = tinted
+    buf = bytearray(w * scale * h * scale * 2)
+    ScaleSprite(src, buf, w, h, scale, 1 if flip else 0)
+    return buf
@@ -0,0 +1,161 @@
+import framebuf
+import micropython
+
+# Surfaces keep their pixels in panel (big-endian) byte order, the same as .tile files and
+# display.blit_buffer, so a flush is a straight copy. framebuf itself works in native
+# (little-endian) order, so colours are byte-swapped on the way into its primitives
+
+@micropython.viper
+def SwapRGB565(c: int) -> int:
+    return ((c & 0xFF) << 8) | ((c >> 8) & 0xFF)
+
+@micropython.viper
+def SwapBytes(buf: ptr16, n: int):
+    for i in range(n):
+        c = buf[i]
+        buf[i] = ((c & 0xFF) << 8) | ((c >> 8) & 0xFF)
+
+@micropython.viper
+def BlitGlyph(font: ptr8, base: int, rowBytes: int, fw: int, fh: int,
+              buf: ptr16, bufW: int, bufH: int, x: int, y: int,
+              fg: int, bg: int, opaque: int):
+    for row in range(fh):
+        py = y + row
+        if py < 0 or py >= bufH:
+            continue
+        srcRow = base + row * rowBytes
+        dstRow = py * bufW
+        for col in range(fw):
+            px = x + col
+            if px < 0 or px >= bufW:
+                continue
+            if font[srcRow + (col >> 3)] & (0x80 >> (col & 7)):
+                buf[dstRow + px] = fg
+            elif opaque:
+                buf[dstRow + px] = bg
+
+class Surface:
+    def __init__(self, width, height, buf=None):
+        self.width = width
+        self.height = height
+        self.buf = buf if buf is not None else bytearray(width * height * 2)
+        self.fb = framebuf.FrameBuffer(self.buf, width, height, framebuf.RGB565)
+
+    # Drawing; these mirror the st7789 driver so a Surface can stand in for the display
+
+    def fill(self, color):
+        self.fb.fill(SwapRGB565(color))
+
+    def fill_rect(self, x, y, w, h, color):
+        self.fb.fill_rect(x, y, w, h, SwapRGB565(color))
+
+    def rect(self, x, y, w, h, color):
+        self.fb.rect(x, y, w, h, SwapRGB565(color))
+
+    def hline(self, x, y, w, color):
+        self.fb.hline(x, y, w, SwapRGB565(color))
+
+    def vline(self, x, y, h, color):
+        self.fb.vline(x, y, h, SwapRGB565(color))
+
+    def line(self, x0, y0, x1, y1, color):
+        self.fb.line(x0, y0, x1, y1, SwapRGB565(color))
+
+    def pixel(self, x, y, color=None):
+        if color is None:
+            return SwapRGB565(self.fb.pixel(x, y) or 0)
+        self.fb.pixel(x, y, SwapRGB565(color))
+
+    def circle(self, x, y, r, color):
+        # Same midpoint circle as the st7789 driver, so a proxied display draws identical pixels
+        c = SwapRGB565(color)
+        fb = self.fb
+        fb.pixel(x, y + r, c)
+        fb.pixel(x, y - r, c)
+        fb.pixel(x + r, y, c)
+        fb.pixel(x - r, y, c)
+        f = 1 - r
+        ddx = 1
+        ddy = -2 * r
+        px = 0
+        py = r
+        while px < py:
+            if f >= 0:
+                py -= 1
+                ddy += 2
+                f += ddy
+            px += 1
+            ddx += 2
+            f += ddx
+            fb.pixel(x + px, y + py, c)
+            fb.pixel(x - px, y + py, c)
+            fb.pixel(x + px, y - py, c)
+            fb.pixel(x - px, y - py, c)
+            fb.pixel(x + py, y + px, c)
+            fb.pixel(x - py, y + px, c)
+            fb.pixel(x + py, y - px, c)
+            fb.pixel(x - py, y - px, c)
+
+    def fill_circle(self, x, y, r, color):
+        c = SwapRGB565(color)
+        fb = self.fb
+        fb.vline(x, y - r, 2 * r + 1, c)
+        f = 1 - r
+        ddx = 1
+        ddy = -2 * r
+        px = 0
+        py = r
+        while px < py:
+            if f >= 0:
+                py -= 1
+                ddy += 2
+                f += ddy
+            px += 1
+            ddx += 2
+            f += ddx
+            fb.vline(x + px, y - py, 2 * py + 1, c)
+            fb.vline(x + py, y - px, 2 * px + 1, c)
+            fb.vline(x - px, y - py, 2 * py + 1, c)
+            fb.vline(x - py, y - px, 2 * px + 1, c)
+
+    def text(self, font, msg, x, y, fg=0xFFFF, bg=0x0000):
+        # Same arguments as st7789 text(); bg=None draws only the glyph pixels
+        fw = font.WIDTH
+        fh = font.HEIGHT
+        rowBytes = (fw + 7) >> 3
+        glyphBytes = rowBytes * fh
+        first = font.FIRST
+        last = font.LAST
+        data = font.FONT
+        fgS = SwapRGB565(fg)
+        bgS = SwapRGB565(bg) if bg is not None else 0
+        opaque = 1 if bg is not None else 0
+        for ch in msg:
+            code = ord(ch)
+            if first <= code <= last:
+                BlitGlyph(data, (code - first) * glyphBytes, rowBytes, fw, fh,
+                          self.buf, self.width, self.height, x, y, fgS, bgS, opaque)
+            x += fw
+
+    def blit_buffer(self, buf, x, y, w, h):
+        self.fb.blit(framebuf.FrameBuffer(buf, w, h, framebuf.RGB565), x, y)
+
+    def blit(self, src, x, y, transparent=-1):
+        # src is another Surface, or a (buffer, w, h) tuple of panel-order pixels such as a tile
+        if isinstance(src, Surface):
+            fb = src.fb
+        else:
+            fb = framebuf.FrameBuffer(src[0], src[1], src[2], framebuf.RGB565)
+        self.fb.blit(fb, x, y, SwapRGB565(transparent) if transparent >= 0 else -1)
+
+    def scroll(self, dx, dy):
+        self.fb.scroll(dx, dy)
+
+    # Output
+
+    def Flush(self, display, x=0, y=0):
+        display.blit_buffer(self.buf, x, y, self.width, self.height)
+
+    def SwapBytes(self):
+        # Convert the whole surface between panel order and framebuf's native order
+        SwapBytes(self.buf, self.width * self.height)
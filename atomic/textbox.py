@@ -145,6 +145,15 @@ class TextBox:
     def Flush(self):
         self._Redraw()
 
+    def Draw(self, target, offsetY=0):
+        # Paint the whole box onto another target (e.g. a transition strip whose row 0 is screen row offsetY)
+        y = self.startY - offsetY
+        target.fill_rect(self.startX, y, self.widthPx, self.heightPx, self.bg)
+        for r in range(self.heightChars):
+            line = self.lines[r]
+            if line:
+                DrawText(target, self.font, line, self.startX, y + r * self.charH, self.fg, self.bg, 0, 0)
+
     def _NewLine(self):
         self.curCol = 0
 
@@ -252,3 +261,8 @@ def Flush():
     global _textBox
     if _textBox:
         _textBox.Flush()
+
+def DrawTextBox(target, offsetY=0):
+    global _textBox
+    if _textBox:
+        _textBox.Draw(target, offsetY)
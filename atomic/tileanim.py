@@ -0,0 +1,99 @@
+import micropython
+from array import array
+from atomic.graphics import BlitRect
+from atomic.tilemap import ANIMATED
+
+@micropython.viper
+def _FindChanged(cells: ptr8, width: int, tx0: int, ty0: int, tx1: int, ty1: int,
+                 changed: ptr8, out: ptr16, maxCells: int) -> int:
+    # Collects (tx, ty) of every cell in the range whose tile ID is marked in changed
+    n = 0
+    for ty in range(ty0, ty1 + 1):
+        row = ty * width
+        for tx in range(tx0, tx1 + 1):
+            if changed[cells[row + tx]]:
+                if n >= maxCells:
+                    return n
+                out[n << 1] = tx
+                out[(n << 1) + 1] = ty
+                n += 1
+    return n
+
+class TileAnimator:
+    # Cycles tiles through animation frames. tiles always holds the current frame of every tile,
+    # so it can be used as the tileset for any renderer
+    def __init__(self, tileset, tileSize=16, maxCells=256):
+        self.tiles = dict(tileset)
+        self.tileSize = tileSize
+        self.anims = {} # tile ID -> [frames, frameMs, current frame]
+        self.changed = bytearray(256)
+        self.cells = array("H", [0] * (maxCells * 2)) # (tx, ty) pairs found by Draw()
+        self.maxCells = maxCells
+        self.scratch = bytearray(tileSize * tileSize * 2)
+        self.skipped = 0 # changed cells left to the caller by the last Draw()
+
+    def Add(self, tile, frames, frameMs=250, tilemap=None):
+        i = ord(tile) if isinstance(tile, str) else tile
+        self.anims[i] = [frames, frameMs, 0]
+        self.tiles[i] = frames[0]
+        if tilemap is not None:
+            tilemap.flags[i] |= ANIMATED
+
+    def Update(self, nowMs):
+        # Advance every animation to the frame due at nowMs; returns how many tiles changed
+        changed = self.changed
+        count = 0
+        for i, anim in self.anims.items():
+            frame = (nowMs // anim[1]) % len(anim[0])
+            if frame != anim[2]:
+                anim[2] = frame
+                self.tiles[i] = anim[0][frame]
+                changed[i] = 1
+                count += 1
+            else:
+                changed[i] = 0
+        return count
+
+    def Draw(self, display, tilemap, camX=0, camY=0, width=240, height=240, x=0, y=0, skip=None):
+        # Redraw just the visible cells whose tile changed on the last Update(); returns the count.
+        # Cells touching skip (x, y, w, h in view pixels, e.g. under a sprite) aren't drawn, so the
+        # caller can composite them with what's on top instead; self.skipped says how many there were
+        self.skipped = 0
+        ts = self.tileSize
+        tx0 = camX // ts
+        ty0 = camY // ts
+        tx1 = (camX + width - 1) // ts
+        ty1 = (camY + height - 1) // ts
+        tx0 = tx0 if tx0 > 0 else 0
+        ty0 = ty0 if ty0 > 0 else 0
+        tx1 = tx1 if tx1 < tilemap.width else tilemap.width - 1
+        ty1 = ty1 if ty1 < tilemap.height else tilemap.height - 1
+        if tx1 < tx0 or ty1 < ty0:
+            return 0
+
+        n = _FindChanged(tilemap.cells, tilemap.width, tx0, ty0, tx1, ty1,
+                         self.changed, self.cells, self.maxCells)
+        cells = self.cells
+        drawn = 0
+        for i in range(n):
+            tx = cells[i << 1]
+            ty = cells[(i << 1) + 1]
+            sx = tx * ts - camX
+            sy = ty * ts - camY
+            if skip is not None and sx < skip[0] + skip[2] and skip[0] < sx + ts \
+                    and sy < skip[1] + skip[3] and skip[1] < sy + ts:
+                self.skipped += 1
+                continue
+            drawn += 1
+            tile = self.tiles[tilemap.cells[ty * tilemap.width + tx]]
+            if sx >= 0 and sy >= 0 and sx + ts <= width and sy + ts <= height:
+                display.blit_buffer(tile, x + sx, y + sy, ts, ts)
+                continue
+            # Cell straddles the edge of the view; send only the visible part
+            vx0 = sx if sx > 0 else 0
+            vy0 = sy if sy > 0 else 0
+            vw = (sx + ts if sx + ts < width else width) - vx0
+            vh = (sy + ts if sy + ts < height else height) - vy0
+            BlitRect(tile, ts, ts, self.scratch, vw, vh, sx - vx0, sy - vy0)
+            display.blit_buffer(memoryview(self.scratch)[:vw * vh * 2], x + vx0, y + vy0, vw, vh)
+        return drawn
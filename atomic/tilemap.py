@@ -0,0 +1,111 @@
+import micropython
+from array import array
+
+# Per-tile flags
+SOLID     = 1
+ANIMATED  = 2
+ENCOUNTER = 4
+
+OUTSIDE = -1 # tile ID returned for cells off the map
+
+@micropython.viper
+def _Cell(cells: ptr8, width: int, height: int, tx: int, ty: int) -> int:
+    if tx < 0 or ty < 0 or tx >= width or ty >= height:
+        return -1
+    return cells[ty * width + tx]
+
+@micropython.viper
+def _AnyFlag(cells: ptr8, flags: ptr8, width: int, height: int,
+             tx0: int, ty0: int, tx1: int, ty1: int, flag: int, outside: int) -> int:
+    for ty in range(ty0, ty1 + 1):
+        for tx in range(tx0, tx1 + 1):
+            if tx < 0 or ty < 0 or tx >= width or ty >= height:
+                if outside & flag:
+                    return 1
+            elif flags[cells[ty * width + tx]] & flag:
+                return 1
+    return 0
+
+def _Id(tile):
+    return ord(tile) if isinstance(tile, str) else tile
+
+def _SetProps(flags, rates, tile, solid, animated, rate):
+    i = _Id(tile)
+    if animated is None: # leave it as it is, e.g. already set by a TileAnimator
+        animated = flags[i] & ANIMATED
+    flags[i] = (SOLID if solid else 0) | (ANIMATED if animated else 0) | (ENCOUNTER if rate else 0)
+    rates[i] = rate
+
+class Tilemap:
+    # A map of 8-bit tile IDs in one bytearray, with a 256-entry property table shared by every
+    # cell of the same ID. Rows can be indexed like a list of lists (tilemap[ty][tx])
+    def __init__(self, width, height, cells=None, tileSize=16):
+        self.width = width
+        self.height = height
+        self.tileSize = tileSize
+        self.cells = cells if cells is not None else bytearray(width * height)
+        self.flags = bytearray(256)
+        self.rates = array("f", [0] * 256)
+        self.outside = SOLID # flags that cells off the map count as having
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, ty):
+        return memoryview(self.cells)[ty * self.width:(ty + 1) * self.width]
+
+    # Cells
+
+    def Get(self, tx, ty):
+        return _Cell(self.cells, self.width, self.height, tx, ty)
+
+    def Set(self, tx, ty, tile):
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            self.cells[ty * self.width + tx] = _Id(tile)
+
+    def At(self, x, y):
+        # Tile ID under a pixel position
+        return _Cell(self.cells, self.width, self.height, x // self.tileSize, y // self.tileSize)
+
+    # Properties
+
+    def SetProps(self, tile, solid=False, animated=None, rate=0):
+        # rate is the chance per step of an encounter on this tile
+        _SetProps(self.flags, self.rates, tile, solid, animated, rate)
+
+    def Flags(self, tx, ty):
+        tile = _Cell(self.cells, self.width, self.height, tx, ty)
+        return self.outside if tile < 0 else self.flags[tile]
+
+    def IsSolid(self, tx, ty):
+        return bool(self.Flags(tx, ty) & SOLID)
+
+    def RateAt(self, x, y):
+        tile = self.At(x, y)
+        return 0 if tile < 0 else self.rates[tile]
+
+    def Touches(self, x, y, w, h, flag=SOLID):
+        # Whether any tile under the pixel rectangle has the flag, e.g. for collision checks
+        ts = self.tileSize
+        return bool(_AnyFlag(self.cells, self.flags, self.width, self.height,
+                             x // ts, y // ts, (x + w - 1) // ts, (y + h - 1) // ts, flag, self.outside))
+
+    def Tileset(self, named):
+        # {"." : tile, ...} -> {ID: tile}, ready for RenderTiles/Viewport
+        return {_Id(name): tile for name, tile in named.items()}
+
+def LoadTilemap(path, tileSize=16):
+    # Text maps with one character per cell; each character's code is its tile ID
+    with open(path, "rb") as f:
+        return ParseTilemap(f.read(), tileSize)
+
+def ParseTilemap(data, tileSize=16):
+    # The same, from text already in memory (e.g. read out of a Pack)
+    lines = [line.strip() for line in bytes(data).split(b"\n")]
+    lines = [line for line in lines if line]
+    width = max(len(line) for line in lines)
+    cells = bytearray(width * len(lines))
+    for ty in range(len(lines)):
+        line = lines[ty]
+        cells[ty * width:ty * width + len(line)] = line
+    return Tilemap(width, len(lines), cells, tileSize)
@@ -8,10 +8,8 @@ def GetTileCoordsPacked(x: int, y: int, tileSize: int) -> int:
 
 @micropython.native
 def GetTileCoords(x: int, y: int, tileSize: int) -> tuple:
-    packed = GetTileCoordsPacked(x, y, tileSize)
-    tileY = packed >> 16
-    tileX = packed & 0xFFFF
-    return tileX, tileY
+    # Plain floor division rather than unpacking, so negative and large positions stay correct
+    return x // tileSize, y // tileSize
 
 @micropython.viper
 def GetCoveredTileCoordsPacked(x: int, y: int, radius: int) -> int:
@@ -28,3 +26,47 @@ def GetCoveredTileCoords(packed: int):
     left   = (packed >> 8)  & 0xFF
     right  =  packed & 0xFF
     return top, bottom, left, right
+
+# Variants for large maps: any tile size, signed 16-bit results, and no allocation.
+# out is a caller-owned array("h"). Only non-negative values are divided, so negative
+# positions floor correctly however the division rounds
+
+@micropython.viper
+def GetCoveredTileBounds(x: int, y: int, radius: int, tileSize: int, out: ptr16):
+    a = x - radius
+    left = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    a = y - radius
+    top = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    a = x + radius - 1
+    right = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    a = y + radius - 1
+    bottom = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    out[0] = top
+    out[1] = bottom
+    out[2] = left
+    out[3] = right
+
+@micropython.viper
+def GetCoveredTiles(x: int, y: int, radius: int, tileSize: int, out: ptr16, maxTiles: int) -> int:
+    # Writes (tileX, tileY) pairs for every covered tile, row by row; returns how many were written
+    a = x - radius
+    left = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    a = y - radius
+    top = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    a = x + radius - 1
+    right = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    a = y + radius - 1
+    bottom = a // tileSize if a >= 0 else 0 - ((tileSize - 1 - a) // tileSize)
+    n = 0
+    ty = top
+    while ty <= bottom:
+        tx = left
+        while tx <= right:
+            if n >= maxTiles:
+                return n
+            out[n << 1] = tx
+            out[(n << 1) + 1] = ty
+            n += 1
+            tx += 1
+        ty += 1
+    return n
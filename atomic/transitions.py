@@ -0,0 +1,96 @@
+from random import randint
+from time import sleep
+
+from atomic.graphics import BlendBuffer, BlendLUT, BlitRect
+from atomic.surface import Surface
+
+# Full-screen transitions that never hold a whole frame in RAM. The picture being shown (or
+# hidden) comes from a render(strip, y) callback that draws the screen rows starting at y into
+# strip, a Surface the width of the screen and a few rows tall; row 0 of strip is screen row y
+
+def _Push(display, strip, y, h):
+    display.blit_buffer(memoryview(strip.buf)[:strip.width * h * 2], 0, y, strip.width, h)
+
+def _PushColumns(display, strip, scratch, x, y, w, h):
+    # Gather a column band out of the strip so it can go out in one blit
+    BlitRect(memoryview(strip.buf)[x * 2:], w, h, scratch, w, h, 0, 0, -1, strip.width)
+    display.blit_buffer(memoryview(scratch)[:w * h * 2], x, y, w, h)
+
+def _Fade(display, render, color, weights, delay, width, height, rows):
+    strip = Surface(width, rows)
+    lut = None
+    for weight in weights:
+        lut = BlendLUT(color, weight, lut)
+        for y in range(0, height, rows):
+            h = rows if y + rows <= height else height - y
+            render(strip, y)
+            BlendBuffer(strip.buf, width * h, lut)
+            _Push(display, strip, y, h)
+        sleep(delay)
+
+def FadeOut(display, render, color=0x0000, steps=8, delay=0.03, width=240, height=240, rows=16):
+    # From the rendered picture to a solid colour
+    _Fade(display, render, color, [(i + 1) / steps for i in range(steps)], delay, width, height, rows)
+
+def FadeIn(display, render, color=0x0000, steps=8, delay=0.03, width=240, height=240, rows=16):
+    # From a solid colour to the rendered picture
+    _Fade(display, render, color, [(steps - 1 - i) / steps for i in range(steps)], delay, width, height, rows)
+
+def Wipe(display, render, direction="down", steps=15, delay=0.03, width=240, height=240, rows=16):
+    # Uncovers the rendered picture over whatever is on screen, one band per step
+    strip = Surface(width, rows)
+    if direction in ("down", "up"):
+        band = (height + steps - 1) // steps
+        for i in range(steps):
+            start = i * band if direction == "down" else height - (i + 1) * band
+            end = start + band
+            start = start if start > 0 else 0
+            end = end if end < height else height
+            for y in range(start, end, rows):
+                h = rows if y + rows <= end else end - y
+                render(strip, y)
+                _Push(display, strip, y, h)
+            sleep(delay)
+        return
+
+    band = (width + steps - 1) // steps
+    scratch = bytearray(band * rows * 2)
+    for i in range(steps):
+        start = i * band if direction == "right" else width - (i + 1) * band
+        end = start + band
+        start = start if start > 0 else 0
+        end = end if end < width else width
+        if end <= start:
+            continue
+        for y in range(0, height, rows):
+            h = rows if y + rows <= height else height - y
+            render(strip, y)
+            _PushColumns(display, strip, scratch, start, y, end - start, h)
+        sleep(delay)
+
+def Dissolve(display, render, block=16, steps=8, delay=0.03, width=240, height=240):
+    # Uncovers the rendered picture in block-sized squares, in a random order
+    cols = (width + block - 1) // block
+    blockRows = (height + block - 1) // block
+    order = list(range(cols * blockRows))
+    for i in range(len(order) - 1, 0, -1):
+        j = randint(0, i)
+        order[i], order[j] = order[j], order[i]
+
+    strip = Surface(width, block)
+    scratch = bytearray(block * block * 2)
+    perStep = (len(order) + steps - 1) // steps
+    for i in range(steps):
+        batch = sorted(order[i * perStep:(i + 1) * perStep])
+        renderedRow = -1
+        for cell in batch:
+            by = cell // cols
+            x = (cell % cols) * block
+            y = by * block
+            if by != renderedRow:
+                render(strip, y)
+                renderedRow = by
+            w = block if x + block <= width else width - x
+            h = block if y + block <= height else height - y
+            _PushColumns(display, strip, scratch, x, y, w, h)
+        sleep(delay)
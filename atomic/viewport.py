@@ -0,0 +1,173 @@
+import micropython
+from atomic.graphics import BlitRect
+
+PANEL_WIDTH = 240
+PANEL_ROWS = 320 # rows of ST7789 frame memory, shown or not; the scroll area is defined within them
+
+@micropython.viper
+def _Fill(buf: ptr16, n: int, color: int):
+    for i in range(n):
+        buf[i] = color
+
+def RenderTiles(buf, bufW, bufH, tilemap, tileset, camX, camY, tileSize=16, clip=None, trans=-1):
+    # Draws the part of the map under clip (x, y, w, h in buffer pixels, default the whole buffer)
+    # with the buffer's top-left at world pixel (camX, camY); cells off the map or missing from
+    # the tileset are left untouched, as are tile pixels of colour trans
+    if clip is None:
+        clip = (0, 0, bufW, bufH)
+    cx, cy, cw, ch = clip
+    if cw <= 0 or ch <= 0:
+        return
+    tx0 = (camX + cx) // tileSize
+    ty0 = (camY + cy) // tileSize
+    tx1 = (camX + cx + cw - 1) // tileSize
+    ty1 = (camY + cy + ch - 1) // tileSize
+    if ty0 < 0:
+        ty0 = 0
+    if ty1 >= len(tilemap):
+        ty1 = len(tilemap) - 1
+
+    for ty in range(ty0, ty1 + 1):
+        row = tilemap[ty]
+        last = tx1 if tx1 < len(row) else len(row) - 1
+        dy = ty * tileSize - camY
+        for tx in range(tx0 if tx0 > 0 else 0, last + 1):
+            tile = tileset.get(row[tx])
+            if tile:
+                BlitRect(tile, tileSize, tileSize, buf, bufW, bufH,
+                         tx * tileSize - camX, dy, trans, 0, clip)
+
+class Viewport:
+    # A camera onto a tilemap that can be larger than the screen, drawn straight to the panel
+    # through one strip buffer rather than a full-frame shadow. Vertical moves scroll the panel
+    # itself (its hardware scroll) so only the newly exposed rows are rendered and sent. The panel
+    # can't scroll sideways, so after a horizontal move every pixel is different and the whole view
+    # is sent again, a strip at a time (240x240: 115 KB, about 16 ms of SPI at 60 MHz)
+    def __init__(self, display, tilemap, tileset, tileSize=16, width=240, height=240,
+                 x=0, y=0, background=0x0000, stripBytes=4096, hardwareScroll=True):
+        self.display = display
+        self.tilemap = tilemap
+        self.tileset = tileset
+        self.tileSize = tileSize
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.background = ((background & 0xFF) << 8) | ((background >> 8) & 0xFF) # as read through a ptr16
+        self.strip = memoryview(bytearray(max(stripBytes, width * 2)))
+        self.camX = 0
+        self.camY = 0
+
+        # The scroll area is whole panel rows, so it only works for a full-width view
+        self.hardwareScroll = hardwareScroll and x == 0 and width == PANEL_WIDTH
+        self.scroll = 0 # rows the panel image is scrolled by; view row r is shown from panel row (r + scroll) % height
+        if self.hardwareScroll:
+            display.vscrdef(y, height, PANEL_ROWS - y - height)
+            display.vscsad(y)
+
+        self.totalPixels = 0 # pixels sent so far
+        self.Redraw()
+
+    def Close(self):
+        # Put the panel's scroll back, e.g. before leaving the game
+        if self.hardwareScroll:
+            self.scroll = 0
+            self.display.vscsad(self.y)
+
+    def SetMap(self, tilemap, tileset=None):
+        self.tilemap = tilemap
+        if tileset is not None:
+            self.tileset = tileset
+        self.Redraw()
+
+    def Redraw(self):
+        self.Restore(0, 0, self.width, self.height)
+
+    def Restore(self, x, y, w, h):
+        # Re-render the map over an area, e.g. to erase a sprite drawn on top
+        self._Compose(x, y, w, h)
+
+    def blit(self, src, x, y, transparent=-1):
+        # Draw a sprite over the map: the tiles under it and the sprite are combined in the strip
+        # buffer and sent together. src is a Surface or a (buffer, w, h) tuple
+        if isinstance(src, tuple):
+            buf, w, h = src
+        else:
+            buf, w, h = src.buf, src.width, src.height
+        self._Compose(x, y, w, h, buf, transparent)
+
+    def blit_buffer(self, buf, x, y, w, h):
+        self._Compose(x, y, w, h, buf)
+
+    def _Compose(self, x, y, w, h, sprite=None, trans=-1):
+        x0 = x if x > 0 else 0
+        y0 = y if y > 0 else 0
+        x1 = x + w if x + w < self.width else self.width
+        y1 = y + h if y + h < self.height else self.height
+        if x1 <= x0 or y1 <= y0:
+            return
+        cw = x1 - x0
+        strip = self.strip
+        rowsPerStrip = len(strip) // (cw << 1)
+        row = y0
+        while row < y1:
+            rows = y1 - row if y1 - row < rowsPerStrip else rowsPerStrip
+            buf = strip[:cw * rows * 2]
+            if sprite is None or trans >= 0:
+                _Fill(buf, cw * rows, self.background)
+                RenderTiles(buf, cw, rows, self.tilemap, self.tileset,
+                            self.camX + x0, self.camY + row, self.tileSize)
+            if sprite is not None:
+                BlitRect(sprite, w, h, buf, cw, rows, x - x0, y - row, trans)
+            self._Send(buf, x0, row, cw, rows)
+            row += rows
+
+    def _Send(self, buf, x, y, w, h):
+        # Sends view rows y to y + h to wherever the panel's scroll shows them; the scroll area
+        # wraps round, so a block can need two windows
+        self.totalPixels += w * h
+        disp = self.display
+        row = (y + self.scroll) % self.height
+        first = self.height - row
+        if first >= h:
+            disp.blit_buffer(buf, self.x + x, self.y + row, w, h)
+            return
+        n = first * w * 2
+        disp.blit_buffer(buf[:n], self.x + x, self.y + row, w, first)
+        disp.blit_buffer(buf[n:], self.x + x, self.y, w, h - first)
+
+    def MoveTo(self, camX, camY):
+        dx = camX - self.camX
+        dy = camY - self.camY
+        if not dx and not dy:
+            return
+        self.camX = camX
+        self.camY = camY
+        height = self.height
+        if dx or not self.hardwareScroll or abs(dy) >= height:
+            self.Redraw()
+            return
+
+        # Scroll the panel and render just the rows that came into view
+        self.scroll = (self.scroll + dy) % height
+        self.display.vscsad(self.y + self.scroll)
+        if dy > 0:
+            self.Restore(0, height - dy, self.width, dy)
+        else:
+            self.Restore(0, 0, self.width, -dy)
+
+    def Move(self, dx, dy):
+        self.MoveTo(self.camX + dx, self.camY + dy)
+
+    def Follow(self, x, y):
+        # Centre the camera on a world point, without showing past the edges of the map
+        mapW = len(self.tilemap[0]) * self.tileSize
+        mapH = len(self.tilemap) * self.tileSize
+        camX = x - (self.width >> 1)
+        camY = y - (self.height >> 1)
+        camX = min(camX, mapW - self.width)
+        camY = min(camY, mapH - self.height)
+        self.MoveTo(camX if camX > 0 else 0, camY if camY > 0 else 0)
+
+    def WorldToScreen(self, x, y):
+        return x - self.camX, y - self.camY
@@ -0,0 +1,91 @@
+from array import array
+from atomic.tilemap import LoadTilemap, ParseTilemap, OUTSIDE, _SetProps
+
+# A world is a grid of equally sized chunk tilemaps, described by a text file with one line
+# per row of chunks: the chunk .tm names separated by spaces, or "-" where there is no chunk.
+# Chunk files are looked up next to the world file, in the same Pack if it came from one
+
+class World:
+    def __init__(self, path, chunkW=15, chunkH=15, tileSize=16, pack=None):
+        self.pack = pack
+        if pack is not None:
+            text = str(pack.Read(path), "utf-8")
+        else:
+            with open(path, "r") as f:
+                text = f.read()
+        self.grid = [line.split() for line in text.split("\n") if line.strip()]
+        slash = path.rfind("/")
+        self.folder = path[:slash + 1]
+        self.chunksY = len(self.grid)
+        self.chunksX = max(len(row) for row in self.grid)
+        self.chunkW = chunkW
+        self.chunkH = chunkH
+        self.tileSize = tileSize
+        self.chunks = {} # (cx, cy) -> Tilemap, only the ones near the player
+
+        # One property table for every chunk
+        self.flags = bytearray(256)
+        self.rates = array("f", [0] * 256)
+
+    def Has(self, cx, cy):
+        return (0 <= cy < self.chunksY and 0 <= cx < len(self.grid[cy])
+                and self.grid[cy][cx] != "-")
+
+    def Chunk(self, cx, cy):
+        chunk = self.chunks.get((cx, cy))
+        if chunk is None and self.Has(cx, cy):
+            path = self.folder + self.grid[cy][cx] + ".tm"
+            if self.pack is not None:
+                chunk = ParseTilemap(self.pack.Read(path), self.tileSize)
+            else:
+                chunk = LoadTilemap(path, self.tileSize)
+            chunk.flags = self.flags
+            chunk.rates = self.rates
+            self.chunks[(cx, cy)] = chunk
+        return chunk
+
+    def ChunkAt(self, x, y):
+        # Chunk coordinates of a world pixel position
+        return x // (self.chunkW * self.tileSize), y // (self.chunkH * self.tileSize)
+
+    def Update(self, x, y, margin=None):
+        # Keep the chunk under (x, y) resident, page in the neighbours it's within margin pixels
+        # of, and drop everything else
+        pw = self.chunkW * self.tileSize
+        ph = self.chunkH * self.tileSize
+        if margin is None:
+            margin = pw >> 2
+        cx = x // pw
+        cy = y // ph
+        lx = x - cx * pw
+        ly = y - cy * ph
+        nx = -1 if lx < margin else (1 if lx >= pw - margin else 0)
+        ny = -1 if ly < margin else (1 if ly >= ph - margin else 0)
+
+        wanted = [(cx, cy)]
+        if nx:
+            wanted.append((cx + nx, cy))
+        if ny:
+            wanted.append((cx, cy + ny))
+        if nx and ny:
+            wanted.append((cx + nx, cy + ny))
+
+        for key in list(self.chunks):
+            if key not in wanted:
+                del self.chunks[key]
+        for key in wanted:
+            self.Chunk(key[0], key[1])
+        return self.Chunk(cx, cy)
+
+    # World-wide lookups, in world tile coordinates
+
+    def Get(self, tx, ty):
+        cx = tx // self.chunkW
+        cy = ty // self.chunkH
+        chunk = self.Chunk(cx, cy)
+        if chunk is None:
+            return OUTSIDE
+        return chunk.Get(tx - cx * self.chunkW, ty - cy * self.chunkH)
+
+    def SetProps(self, tile, solid=False, animated=None, rate=0):
+        _SetProps(self.flags, self.rates, tile, solid, animated, rate)
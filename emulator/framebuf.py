@@ -0,0 +1,223 @@
+# PithOS host emulator - stand-in for MicroPython's framebuf module
+# Pixel layouts match the C implementation (RGB565 is stored native/little-endian)
+
+import vga2_8x16 as _font
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+RGB565    = 1
+GS2_HMSB  = 5
+GS4_HMSB  = 2
+GS8       = 6
+MVLSB     = MONO_VLSB
+
+# framebuf's built-in font is 8x8; squash the 8x16 stand-in by taking every other row
+_FONT8 = bytes(_font._FONT[i] for i in range(len(_font._FONT)) if (i & 1))
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = memoryview(buffer).cast("B")
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        if format == RGB565:
+            need = self.stride * height * 2
+        elif format == GS8:
+            need = self.stride * height
+        elif format == GS4_HMSB:
+            need = ((self.stride + 1) >> 1) * height
+        elif format == GS2_HMSB:
+            need = ((self.stride + 3) >> 2) * height
+        elif format == MONO_VLSB:
+            need = self.stride * ((height + 7) >> 3)
+        elif format in (MONO_HLSB, MONO_HMSB):
+            need = ((self.stride + 7) >> 3) * height
+        else:
+            raise ValueError("invalid format")
+        if len(self.buf) < need:
+            raise ValueError("buffer too small")
+
+    def _Get(self, x, y):
+        f = self.format
+        b = self.buf
+        if f == RGB565:
+            i = (y * self.stride + x) << 1
+            return b[i] | (b[i + 1] << 8)
+        if f == GS8:
+            return b[y * self.stride + x]
+        if f == GS4_HMSB:
+            v = b[(y * self.stride + x) >> 1]
+            return (v & 0x0F) if (x & 1) else (v >> 4)
+        if f == GS2_HMSB:
+            v = b[(y * self.stride + x) >> 2]
+            return (v >> ((x & 3) << 1)) & 3
+        if f == MONO_VLSB:
+            return (b[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+        i = y * ((self.stride + 7) >> 3) + (x >> 3)
+        if f == MONO_HLSB:
+            return (b[i] >> (7 - (x & 7))) & 1
+        return (b[i] >> (x & 7)) & 1
+
+    def _Set(self, x, y, c):
+        f = self.format
+        b = self.buf
+        if f == RGB565:
+            i = (y * self.stride + x) << 1
+            b[i] = c & 0xFF
+            b[i + 1] = (c >> 8) & 0xFF
+        elif f == GS8:
+            b[y * self.stride + x] = c & 0xFF
+        elif f == GS4_HMSB:
+            i = (y * self.stride + x) >> 1
+            if x & 1:
+                b[i] = (b[i] & 0xF0) | (c & 0x0F)
+            else:
+                b[i] = (b[i] & 0x0F) | ((c & 0x0F) << 4)
+        elif f == GS2_HMSB:
+            i = (y * self.stride + x) >> 2
+            s = (x & 3) << 1
+            b[i] = (b[i] & ~(3 << s) & 0xFF) | ((c & 3) << s)
+        elif f == MONO_VLSB:
+            i = (y >> 3) * self.stride + x
+            m = 1 << (y & 7)
+            b[i] = (b[i] | m) if c else (b[i] & ~m & 0xFF)
+        else:
+            i = y * ((self.stride + 7) >> 3) + (x >> 3)
+            m = (0x80 >> (x & 7)) if f == MONO_HLSB else (1 << (x & 7))
+            b[i] = (b[i] | m) if c else (b[i] & ~m & 0xFF)
+
+    def _FillRect(self, x, y, w, h, c):
+        x0 = max(x, 0); y0 = max(y, 0)
+        x1 = min(x + w, self.width); y1 = min(y + h, self.height)
+        if x1 <= x0 or y1 <= y0:
+            return
+        if self.format == RGB565:
+            run = bytes((c & 0xFF, (c >> 8) & 0xFF)) * (x1 - x0)
+            for row in range(y0, y1):
+                i = (row * self.stride + x0) << 1
+                self.buf[i:i + len(run)] = run
+        elif self.format == GS8:
+            run = bytes((c & 0xFF,)) * (x1 - x0)
+            for row in range(y0, y1):
+                i = row * self.stride + x0
+                self.buf[i:i + len(run)] = run
+        else:
+            for row in range(y0, y1):
+                for col in range(x0, x1):
+                    self._Set(col, row, c)
+
+    def fill(self, c):
+        self._FillRect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        self._FillRect(x, y, w, h, c)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if c is None:
+            return self._Get(x, y)
+        self._Set(x, y, c)
+
+    def hline(self, x, y, w, c):
+        self._FillRect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self._FillRect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self._FillRect(x, y, w, h, c)
+            return
+        self._FillRect(x, y, w, 1, c)
+        self._FillRect(x, y + h - 1, w, 1, c)
+        self._FillRect(x, y, 1, h, c)
+        self._FillRect(x + w - 1, y, 1, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        dx = abs(x1 - x0); sx = 1 if x0 < x1 else -1
+        dy = -abs(y1 - y0); sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x0, y0, c)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy; x0 += sx
+            if e2 <= dx:
+                err += dx; y0 += sy
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            code = ord(ch)
+            if code < 32 or code > 127:
+                code = 127
+            base = code * 8
+            for row in range(8):
+                bits = _FONT8[base + row]
+                for col in range(8):
+                    if bits & (0x80 >> col):
+                        self.pixel(x + col, y + row, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        if key == -1 and palette is None and fbuf.format == self.format == RGB565:
+            # Opaque same-format blit is a straight row copy
+            x0 = max(x, 0); x1 = min(x + fbuf.width, self.width)
+            if x1 <= x0:
+                return
+            n = (x1 - x0) << 1
+            for dy in range(max(y, 0), min(y + fbuf.height, self.height)):
+                s = ((dy - y) * fbuf.stride + (x0 - x)) << 1
+                d = (dy * self.stride + x0) << 1
+                self.buf[d:d + n] = fbuf.buf[s:s + n]
+            return
+        for sy in range(fbuf.height):
+            dy = y + sy
+            if dy < 0 or dy >= self.height:
+                continue
+            for sx in range(fbuf.width):
+                dx = x + sx
+                if dx < 0 or dx >= self.width:
+                    continue
+                c = fbuf._Get(sx, sy)
+                if c == key:
+                    continue
+                if palette is not None:
+                    c = palette._Get(c, 0)
+                self._Set(dx, dy, c)
+
+    def scroll(self, xstep, ystep):
+        w, h = self.width, self.height
+        if self.format == RGB565:
+            # Same result as the per-pixel loop below, a row slice at a time
+            rowBytes = self.stride * 2
+            n = (w - abs(xstep)) * 2
+            if n <= 0 or abs(ystep) >= h:
+                return
+            sx = (-xstep if xstep < 0 else 0) * 2
+            dx = (xstep if xstep > 0 else 0) * 2
+            ys = range(h - 1, ystep - 1, -1) if ystep > 0 else range(0, h + ystep)
+            for dy in ys:
+                s = (dy - ystep) * rowBytes + sx
+                d = dy * rowBytes + dx
+                self.buf[d:d + n] = bytes(self.buf[s:s + n])
+            return
+        ys = range(h - 1, -1, -1) if ystep > 0 else range(h)
+        xs = range(w - 1, -1, -1) if xstep > 0 else range(w)
+        for dy in ys:
+            sy = dy - ystep
+            if not (0 <= sy < h):
+                continue
+            for dx in xs:
+                sx = dx - xstep
+                if 0 <= sx < w:
+                    self._Set(dx, dy, self._Get(sx, sy))
+
+def FrameBuffer1(buffer, width, height, stride=None):
+    return FrameBuffer(buffer, width, height, MONO_VLSB, stride)
@@ -0,0 +1,254 @@
+# PithOS host emulator - shared state
+# Copyright (c) 2026 Henry Gurney
+# Licensed under CC BY-NC-ND 4.0
+
+# Everything the stand-in hardware modules share lives here: the virtual clock,
+# the scripted buttons, the panel framebuffer and the profiling counters
+
+import time as _time
+import struct
+import zlib
+
+SCREEN_W = 240
+SCREEN_H = 240
+
+# Physical button wiring, as used by main.py and every game
+BUTTON_PINS = {
+    "up": 2, "down": 18, "left": 16, "right": 20, "centre": 3,
+    "a": 15, "b": 17, "x": 19, "y": 21
+}
+
+class EmulatorStop(BaseException):
+    # BaseException so games' "except Exception" blocks can't swallow it
+    pass
+
+class Clock:
+    # Virtual microsecond clock: real compute time plus skipped sleep time, so
+    # headless runs don't wait but frame times are still measured for real
+    def __init__(self, realtime=False):
+        self.realtime = realtime
+        self.start = _time.perf_counter()
+        self.slept = 0
+        self.limitUs = None
+
+    def Us(self):
+        return int((_time.perf_counter() - self.start) * 1000000) + self.slept
+
+    def Sleep(self, us):
+        if us <= 0:
+            return
+        if self.realtime:
+            _time.sleep(us / 1000000)
+        else:
+            self.slept += int(us)
+
+    def Check(self):
+        if self.limitUs is not None and self.Us() >= self.limitUs:
+            raise EmulatorStop()
+
+class Inputs:
+    # Scripted button presses; each event holds a button down for a time window
+    # Script lines: "<atMs> <button>[+<button>...] [holdMs]", or "<atMs> snap [name]"
+    def __init__(self):
+        self.events = []
+        self.snaps = []
+
+    def Load(self, path):
+        with open(path) as f:
+            self.Parse(f.read())
+
+    def Parse(self, text):
+        for line in text.splitlines():
+            line = line.split("#")[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            at = int(parts[0])
+            if parts[1] == "snap":
+                self.snaps.append((at, parts[2] if len(parts) > 2 else None))
+                continue
+            hold = int(parts[2]) if len(parts) > 2 else 100
+            for name in parts[1].lower().split("+"):
+                if name not in BUTTON_PINS:
+                    raise ValueError(f"Unknown button '{name}' in input script")
+                self.events.append((at, at + hold, BUTTON_PINS[name]))
+        self.snaps.sort(key=lambda s: s[0])
+
+    def Press(self, button, atMs, holdMs=100):
+        self.events.append((atMs, atMs + holdMs, BUTTON_PINS[button]))
+
+    def IsDown(self, pinId, nowMs):
+        for start, end, pin in self.events:
+            if pin == pinId and start <= nowMs < end:
+                return True
+        return False
+
+    def LastEventMs(self):
+        last = 0
+        for _, end, _ in self.events:
+            if end > last:
+                last = end
+        return last
+
+class Stats:
+    # SPI traffic and frame timing counters; a "frame" is the work done between two sleep() calls
+    WINDOW_BYTES = 11 # CASET + RASET + RAMWR commands and their arguments
+
+    def __init__(self):
+        self.spiBytes = 0
+        self.spiTransactions = 0
+        self.pixelBytes = 0
+        self.calls = {}
+        self.frameTimes = []
+        self.frameBytes = []
+        self.frameStartBytes = 0
+
+    def Window(self, call, nPixels):
+        # One windowed RAM write of nPixels pixels
+        self.calls[call] = self.calls.get(call, 0) + 1
+        self.spiTransactions += 1
+        self.spiBytes += self.WINDOW_BYTES + nPixels * 2
+        self.pixelBytes += nPixels * 2
+
+    def Raw(self, nBytes):
+        self.spiTransactions += 1
+        self.spiBytes += nBytes
+
+    def EndFrame(self, computeUs):
+        self.frameTimes.append(computeUs)
+        self.frameBytes.append(self.spiBytes - self.frameStartBytes)
+        self.frameStartBytes = self.spiBytes
+
+    def Summary(self):
+        times = sorted(self.frameTimes)
+        n = len(times)
+        busy = [b for b in self.frameBytes if b]
+        return {
+            "frames": n,
+            "frameMsMean": round(sum(times) / n / 1000, 3) if n else 0,
+            "frameMsP95": round(times[min(n - 1, int(n * 0.95))] / 1000, 3) if n else 0,
+            "frameMsMax": round(times[-1] / 1000, 3) if n else 0,
+            "spiBytes": self.spiBytes,
+            "spiTransactions": self.spiTransactions,
+            "pixelBytes": self.pixelBytes,
+            "spiBytesPerDrawnFrame": (sum(busy) // len(busy)) if busy else 0,
+            "drawCalls": dict(sorted(self.calls.items())),
+        }
+
+class Panel:
+    # The physical 240x240 ST7789 panel RAM, stored big-endian RGB565 like the wire format.
+    # Vertical scrolling (VSCRDEF/VSCSAD) only changes which RAM rows are shown, as on the panel
+    def __init__(self, w=SCREEN_W, h=SCREEN_H):
+        self.w = w
+        self.h = h
+        self.buf = bytearray(w * h * 2)
+        self.scrollTop = 0 # first row of the scroll area
+        self.scrollRows = h # rows in the scroll area
+        self.scrollStart = 0 # RAM row shown at the top of the scroll area
+
+    def ShownRow(self, y):
+        # RAM row shown on screen row y
+        top = self.scrollTop
+        if top <= y < top + self.scrollRows:
+            return top + (y - top + self.scrollStart - top) % self.scrollRows
+        return y
+
+    def Pixel(self, x, y):
+        i = (self.ShownRow(y) * self.w + x) << 1
+        return (self.buf[i] << 8) | self.buf[i + 1]
+
+    def WritePNG(self, path):
+        raw = bytearray()
+        buf = self.buf
+        for y in range(self.h):
+            raw.append(0)
+            row = self.ShownRow(y) * self.w * 2
+            for x in range(self.w):
+                c = (buf[row] << 8) | buf[row + 1]
+                row += 2
+                r = (c >> 11) & 0x1F
+                g = (c >> 5) & 0x3F
+                b = c & 0x1F
+                raw += bytes(((r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)))
+
+        def Chunk(tag, data):
+            body = tag + data
+            return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(Chunk(b"IHDR", struct.pack(">IIBBBBB", self.w, self.h, 8, 2, 0, 0, 0)))
+            f.write(Chunk(b"IDAT", zlib.compress(bytes(raw), 6)))
+            f.write(Chunk(b"IEND", b""))
+
+clock = Clock()
+inputs = Inputs()
+stats = Stats()
+panel = Panel()
+
+snapDir = None
+snapEveryMs = 0
+_nextSnapMs = 0
+_snapCount = 0
+_frameStartUs = 0
+
+def Snap(name=None):
+    global _snapCount
+    if snapDir is None:
+        return
+    t0 = _time.perf_counter()
+    _snapCount += 1
+    if name is None:
+        name = f"frame_{_snapCount:05d}"
+    panel.WritePNG(f"{snapDir}/{name}.png")
+    # Encoding is emulator overhead, so keep it off the virtual clock
+    clock.start += _time.perf_counter() - t0
+
+def OnSleep(us):
+    # Called by time.sleep*: closes the current frame, handles scheduled snapshots and advances the clock
+    global _frameStartUs, _nextSnapMs
+    now = clock.Us()
+    stats.EndFrame(now - _frameStartUs)
+    clock.Sleep(us)
+    nowMs = clock.Us() // 1000
+
+    while inputs.snaps and inputs.snaps[0][0] <= nowMs:
+        Snap(inputs.snaps.pop(0)[1])
+    if snapEveryMs and nowMs >= _nextSnapMs:
+        Snap()
+        _nextSnapMs = nowMs + snapEveryMs
+
+    _frameStartUs = clock.Us()
+    clock.Check()
+
+# Allocation accounting via tracemalloc. These are CPython allocation deltas since the game
+# started, not Pico heap use: host objects are several times bigger than MicroPython's, so
+# compare runs against each other rather than against the Pico 2's 520 KB of SRAM
+HEAP_BYTES = 520 * 1024
+_allocBase = 0
+
+def StartAllocCount():
+    # Call once the emulator is loaded, just before the game starts
+    global _allocBase
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    _allocBase = tracemalloc.get_traced_memory()[0]
+
+def AllocBytes():
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        return 0
+    n = tracemalloc.get_traced_memory()[0] - _allocBase
+    return n if n > 0 else 0
+
+def AllocPeakBytes():
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        return 0
+    n = tracemalloc.get_traced_memory()[1] - _allocBase
+    return n if n > 0 else 0
+
+def AllocReport():
+    return f"host allocations since start: {AllocBytes()} now, {AllocPeakBytes()} peak (CPython sizes, not the Pico heap)"
@@ -0,0 +1,103 @@
+# PithOS host emulator - stand-in for MicroPython's machine module
+
+import harness
+
+_INPUT_PINS = set(harness.BUTTON_PINS.values())
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self.pull = pull
+        self.level = 1 if value is None else int(bool(value))
+
+    def init(self, mode=-1, pull=-1, value=None):
+        self.mode = mode
+        self.pull = pull
+        if value is not None:
+            self.level = int(bool(value))
+
+    def value(self, v=None):
+        if v is not None:
+            self.level = int(bool(v))
+            return None
+        harness.clock.Check()
+        if self.mode == Pin.IN and self.id in _INPUT_PINS:
+            # Buttons are wired active-low with pull-ups
+            return 0 if harness.inputs.IsDown(self.id, harness.clock.Us() // 1000) else 1
+        return self.level
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.level = 1
+
+    def off(self):
+        self.level = 0
+
+    def irq(self, handler=None, trigger=0):
+        return None
+
+    def __repr__(self):
+        return f"Pin({self.id})"
+
+class SPI:
+    def __init__(self, id, baudrate=1000000, polarity=0, phase=0, bits=8,
+                 firstbit=0, sck=None, mosi=None, miso=None):
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate=1000000, **kwargs):
+        self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        harness.stats.Raw(len(buf))
+
+    def read(self, nbytes, write=0x00):
+        harness.stats.Raw(nbytes)
+        return bytes(nbytes)
+
+    def readinto(self, buf, write=0x00):
+        harness.stats.Raw(len(buf))
+
+    def write_readinto(self, wbuf, rbuf):
+        harness.stats.Raw(len(wbuf))
+
+class ADC:
+    # Battery sense on ADC(29) reads through a 1/3 divider; report a healthy ~3.9V cell
+    batteryVolts = 3.9
+
+    def __init__(self, pin):
+        self.pin = pin
+
+    def read_u16(self):
+        if self.pin == 29:
+            return int(self.batteryVolts / 9.9 * 65535)
+        return 0
+
+def freq(hz=None):
+    return 150000000
+
+def reset():
+    raise harness.EmulatorStop()
+
+def soft_reset():
+    raise harness.EmulatorStop()
+
+def unique_id():
+    return b"PITHOSEM"
+
+def idle():
+    pass
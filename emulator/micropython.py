@@ -0,0 +1,100 @@
+# PithOS host emulator - stand-in for the micropython module
+# Native code becomes plain Python; viper pointer arguments are wrapped so ptr8/ptr16/ptr32
+# indexing behaves like it does on the Pico (little-endian, truncating stores, bounds-checked here)
+
+import builtins
+import functools
+import inspect
+
+class _Ptr:
+    FORMAT = "B"
+    MASK = 0xFF
+
+    def __init__(self, obj):
+        if isinstance(obj, _Ptr):
+            obj = obj.mv
+        mv = memoryview(obj).cast("B")
+        if self.FORMAT != "B":
+            size = self.MASK.bit_length() >> 3
+            mv = mv[:len(mv) - len(mv) % size].cast(self.FORMAT)
+        self.mv = mv
+
+    def __getitem__(self, i):
+        return self.mv[i]
+
+    def __setitem__(self, i, v):
+        self.mv[i] = v & self.MASK
+
+    def __len__(self):
+        return len(self.mv)
+
+class ptr8(_Ptr):
+    FORMAT = "B"
+    MASK = 0xFF
+
+class ptr16(_Ptr):
+    FORMAT = "H"
+    MASK = 0xFFFF
+
+class ptr32(_Ptr):
+    FORMAT = "I"
+    MASK = 0xFFFFFFFF
+
+_POINTERS = (ptr8, ptr16, ptr32)
+
+# Viper annotations are evaluated at def time, so the names must exist globally
+builtins.ptr8 = ptr8
+builtins.ptr16 = ptr16
+builtins.ptr32 = ptr32
+builtins.uint = int
+
+def viper(fn):
+    sig = inspect.signature(fn)
+    pointerArgs = [(name, p.annotation) for name, p in sig.parameters.items()
+                   if p.annotation in _POINTERS]
+    if not pointerArgs:
+        return fn
+
+    @functools.wraps(fn)
+    def Wrapped(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        for name, kind in pointerArgs:
+            if name in bound.arguments:
+                bound.arguments[name] = kind(bound.arguments[name])
+        return fn(*bound.args, **bound.kwargs)
+
+    return Wrapped
+
+def native(fn):
+    return fn
+
+def asm_thumb(fn):
+    raise NotImplementedError("asm_thumb functions cannot run on the host")
+
+def const(x):
+    return x
+
+def opt_level(level=None):
+    return 0
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+def heap_lock():
+    pass
+
+def heap_unlock():
+    return 0
+
+def mem_info(verbose=False):
+    import harness
+    print(harness.AllocReport())
+
+def qstr_info(verbose=False):
+    pass
+
+def stack_use():
+    return 0
+
+def schedule(fn, arg):
+    fn(arg)
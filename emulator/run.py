@@ -0,0 +1,136 @@
+# PithOS host emulator - runner
+# Copyright (c) 2026 Henry Gurney
+# Licensed under CC BY-NC-ND 4.0
+
+# Runs PithOS (main.py) or a single game headless on a Linux box, with the stand-in
+# machine/st7789/framebuf/micropython modules from this folder on the import path
+#
+#   python emulator/run.py                          # PithOS menu -> game flow
+#   python emulator/run.py picomon -i picomon.txt   # one game, scripted buttons
+#   python emulator/run.py picopong --snap out/ --snap-every 500 --report stats.json
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+EMU_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(EMU_DIR)
+
+def Setup(args):
+    if EMU_DIR not in sys.path:
+        sys.path.insert(0, EMU_DIR)
+    # Games import their own helper modules relative to the cwd, and atomic from "/"
+    sys.path.insert(1, "")
+    sys.path.insert(2, ROOT)
+
+    import harness
+    import utime
+    utime.Install()
+
+    # Only a rough stand-in: host allocation deltas measured against the Pico's SRAM (see harness)
+    gc.mem_free = lambda: max(0, harness.HEAP_BYTES - harness.AllocBytes())
+    gc.mem_alloc = harness.AllocBytes
+    gc.threshold = lambda *a: None
+
+    # Load the other stand-ins now so they aren't counted against the game
+    import machine, st7789, framebuf, micropython
+
+    harness.clock.realtime = args.realtime
+    if args.inputs:
+        harness.inputs.Load(args.inputs)
+    for spec in args.press or ():
+        harness.inputs.Parse(spec.replace(",", " "))
+    if args.duration is not None:
+        harness.clock.limitUs = int(args.duration * 1000000)
+    elif harness.inputs.events:
+        harness.clock.limitUs = (harness.inputs.LastEventMs() + 2000) * 1000
+    if args.snap:
+        os.makedirs(args.snap, exist_ok=True)
+        harness.snapDir = os.path.abspath(args.snap)
+        harness.snapEveryMs = args.snap_every
+    return harness
+
+def Run(target):
+    # Executed the same way PithOS launches games: from the game folder with a fresh globals dict
+    if target is None:
+        os.chdir(ROOT)
+        path = "main.py"
+    else:
+        os.chdir(os.path.join(ROOT, "games", target))
+        path = "main.py"
+        # Mirror PithOS's Launch(), which batches draw calls for games that ask for it
+        try:
+            with open("info.info") as f:
+                batch = int(eval(f.read()).get("batchDraw", 0))
+        except Exception:
+            batch = 0
+        if batch:
+            from atomic import displayproxy
+            displayproxy.Install()
+    with open(path) as f:
+        code = compile(f.read(), os.path.abspath(path), "exec")
+    exec(code, {"__name__": "__main__"})
+
+def Main(argv=None):
+    parser = argparse.ArgumentParser(description="Run PithOS or a game headless on the host")
+    parser.add_argument("game", nargs="?", help="game folder under games/ (default: the PithOS menu)")
+    parser.add_argument("-i", "--inputs", help="button script file")
+    parser.add_argument("-p", "--press", action="append",
+                        help="inline button event, e.g. '500,a,100' (repeatable)")
+    parser.add_argument("-d", "--duration", type=float, help="stop after this many virtual seconds")
+    parser.add_argument("--snap", help="folder for PNG frame dumps")
+    parser.add_argument("--snap-every", type=int, default=0, help="also dump a frame every N virtual ms")
+    parser.add_argument("--report", help="write the profiling summary as JSON to this path")
+    parser.add_argument("--seed", type=int, help="seed the random module for repeatable runs")
+    parser.add_argument("--realtime", action="store_true", help="really sleep instead of skipping time")
+    args = parser.parse_args(argv)
+
+    if sys.version_info < (3, 12):
+        # MicroPython accepts nested same-quote f-strings (used by Dinner Party); CPython only since 3.12
+        parser.error("the emulator needs Python 3.12 or newer")
+
+    if args.duration is None and not args.inputs and not args.press:
+        args.duration = 5.0
+
+    harness = Setup(args)
+    if args.seed is not None:
+        import random
+        random.seed(args.seed)
+
+    tracemalloc.start()
+    harness.StartAllocCount()
+    harness.clock.start = __import__("time").perf_counter()
+    result = "stopped"
+    try:
+        Run(args.game)
+        result = "exited"
+    except harness.EmulatorStop:
+        pass
+    except SystemExit:
+        result = "exited"
+    finally:
+        os.chdir(ROOT)
+
+    if harness.snapDir:
+        harness.Snap("final")
+
+    summary = harness.stats.Summary()
+    summary["result"] = result
+    summary["virtualSeconds"] = round(harness.clock.Us() / 1000000, 3)
+    summary["hostAllocPeakBytes"] = harness.AllocPeakBytes()
+    summary["hostAllocEndBytes"] = harness.AllocBytes()
+    tracemalloc.stop()
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=2)
+    else:
+        for key, value in summary.items():
+            print(f"{key}: {value}")
+    return summary
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,204 @@
+# PithOS host emulator - stand-in for the st7789_mpy display driver
+# Draws into harness.panel and counts the SPI traffic each call would cause on the real panel
+
+import harness
+
+BLACK   = 0x0000
+BLUE    = 0x001F
+RED     = 0xF800
+GREEN   = 0x07E0
+CYAN    = 0x07FF
+MAGENTA = 0xF81F
+YELLOW  = 0xFFE0
+WHITE   = 0xFFFF
+
+FAST = 0
+SLOW = 1
+
+def color565(r, g=0, b=0):
+    if isinstance(r, (tuple, list)):
+        r, g, b = r[:3]
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+def map_bitarray_to_rgb565(bitarray, buffer, width, color=WHITE, bg_color=BLACK):
+    hi, lo = color >> 8, color & 0xFF
+    bhi, blo = bg_color >> 8, bg_color & 0xFF
+    n = min(len(bitarray) * 8, len(buffer) // 2)
+    for i in range(n):
+        if (bitarray[i >> 3] >> (7 - (i & 7))) & 1:
+            buffer[i * 2], buffer[i * 2 + 1] = hi, lo
+        else:
+            buffer[i * 2], buffer[i * 2 + 1] = bhi, blo
+
+class ST7789:
+    def __init__(self, spi, width, height, reset=None, dc=None, cs=None,
+                 backlight=None, rotation=0, rotations=None, options=0,
+                 buffer_size=0, color_order=0, inversion=True):
+        self.spi = spi
+        self._width = width
+        self._height = height
+        self._rotation = rotation
+        self.panel = harness.panel
+
+    # Control
+
+    def init(self):
+        harness.stats.Raw(64) # reset, sleep-out, colour mode, MADCTL, inversion, display-on
+
+    def on(self):
+        pass
+
+    def off(self):
+        pass
+
+    def sleep_mode(self, value):
+        harness.stats.Raw(1)
+
+    def inversion_mode(self, value):
+        harness.stats.Raw(1)
+
+    def rotation(self, r):
+        self._rotation = r
+        harness.stats.Raw(2)
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def vscrdef(self, tfa, vsa, bfa):
+        # Rows past the 240 the panel shows (the bottom of the 320-row RAM) aren't modelled
+        self.panel.scrollTop = tfa
+        self.panel.scrollRows = min(vsa, self.panel.h - tfa)
+        harness.stats.Raw(7)
+
+    def vscsad(self, vssa):
+        self.panel.scrollStart = vssa
+        harness.stats.Raw(3)
+
+    # Drawing
+
+    def _Fill(self, x, y, w, h, color):
+        p = self.panel
+        x0 = max(x, 0); y0 = max(y, 0)
+        x1 = min(x + w, p.w); y1 = min(y + h, p.h)
+        if x1 <= x0 or y1 <= y0:
+            return 0
+        run = bytes(((color >> 8) & 0xFF, color & 0xFF)) * (x1 - x0)
+        buf = p.buf
+        for row in range(y0, y1):
+            i = (row * p.w + x0) << 1
+            buf[i:i + len(run)] = run
+        return (x1 - x0) * (y1 - y0)
+
+    def fill(self, color):
+        harness.stats.Window("fill", self._Fill(0, 0, self.panel.w, self.panel.h, color))
+
+    def fill_rect(self, x, y, w, h, color):
+        harness.stats.Window("fill_rect", self._Fill(x, y, w, h, color))
+
+    def pixel(self, x, y, color):
+        harness.stats.Window("pixel", self._Fill(x, y, 1, 1, color))
+
+    def hline(self, x, y, w, color):
+        harness.stats.Window("hline", self._Fill(x, y, w, 1, color))
+
+    def vline(self, x, y, h, color):
+        harness.stats.Window("vline", self._Fill(x, y, 1, h, color))
+
+    def rect(self, x, y, w, h, color):
+        self.hline(x, y, w, color)
+        self.vline(x, y, h, color)
+        self.hline(x, y + h - 1, w, color)
+        self.vline(x + w - 1, y, h, color)
+
+    def line(self, x0, y0, x1, y1, color):
+        if y0 == y1:
+            self.hline(min(x0, x1), y0, abs(x1 - x0) + 1, color)
+            return
+        if x0 == x1:
+            self.vline(x0, min(y0, y1), abs(y1 - y0) + 1, color)
+            return
+        dx = abs(x1 - x0); sx = 1 if x0 < x1 else -1
+        dy = -abs(y1 - y0); sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x0, y0, color)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy; x0 += sx
+            if e2 <= dx:
+                err += dx; y0 += sy
+
+    def circle(self, x, y, r, color):
+        # Midpoint circle, as in the C driver
+        self.pixel(x, y + r, color)
+        self.pixel(x, y - r, color)
+        self.pixel(x + r, y, color)
+        self.pixel(x - r, y, color)
+        f = 1 - r; ddx = 1; ddy = -2 * r; px = 0; py = r
+        while px < py:
+            if f >= 0:
+                py -= 1; ddy += 2; f += ddy
+            px += 1; ddx += 2; f += ddx
+            for sx, sy in ((px, py), (py, px)):
+                self.pixel(x + sx, y + sy, color)
+                self.pixel(x - sx, y + sy, color)
+                self.pixel(x + sx, y - sy, color)
+                self.pixel(x - sx, y - sy, color)
+
+    def fill_circle(self, x, y, r, color):
+        self.vline(x, y - r, 2 * r + 1, color)
+        f = 1 - r; ddx = 1; ddy = -2 * r; px = 0; py = r
+        while px < py:
+            if f >= 0:
+                py -= 1; ddy += 2; f += ddy
+            px += 1; ddx += 2; f += ddx
+            self.vline(x + px, y - py, 2 * py + 1, color)
+            self.vline(x + py, y - px, 2 * px + 1, color)
+            self.vline(x - px, y - py, 2 * py + 1, color)
+            self.vline(x - py, y - px, 2 * px + 1, color)
+
+    def _Blit(self, buffer, x, y, w, h):
+        # The buffer goes over the wire as-is, so it is big-endian RGB565
+        p = self.panel
+        src = memoryview(buffer).cast("B")
+        x0 = max(x, 0); x1 = min(x + w, p.w)
+        for row in range(max(y, 0), min(y + h, p.h)):
+            if x1 <= x0:
+                break
+            s = ((row - y) * w + (x0 - x)) << 1
+            d = (row * p.w + x0) << 1
+            n = (x1 - x0) << 1
+            p.buf[d:d + n] = src[s:s + n]
+
+    def blit_buffer(self, buffer, x, y, w, h):
+        self._Blit(buffer, x, y, w, h)
+        harness.stats.Window("blit_buffer", w * h)
+
+    def text(self, font, s, x, y, fg=WHITE, bg=BLACK):
+        # Each glyph is rendered into a buffer and pushed as its own window, like the C driver
+        if isinstance(s, str):
+            s = s.encode()
+        fw = font.WIDTH
+        fh = font.HEIGHT
+        rowBytes = (fw + 7) >> 3
+        glyphBytes = rowBytes * fh
+        data = font.FONT
+        fgB = bytes((fg >> 8 & 0xFF, fg & 0xFF))
+        bgB = bytes((bg >> 8 & 0xFF, bg & 0xFF))
+        for ch in s:
+            if ch < font.FIRST or ch > font.LAST:
+                continue
+            base = (ch - font.FIRST) * glyphBytes
+            out = bytearray()
+            for row in range(fh):
+                for col in range(fw):
+                    bit = data[base + row * rowBytes + (col >> 3)] & (0x80 >> (col & 7))
+                    out += fgB if bit else bgB
+            self._Blit(out, x, y, fw, fh)
+            harness.stats.Window("text", fw * fh)
+            x += fw
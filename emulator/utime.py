@@ -0,0 +1,51 @@
+# PithOS host emulator - MicroPython time functions on the virtual clock
+
+import time as _time
+import harness
+
+_EPOCH_2000 = 946684800
+_TICKS_PERIOD = 1 << 30
+
+def ticks_us():
+    harness.clock.Check()
+    return harness.clock.Us() & (_TICKS_PERIOD - 1)
+
+def ticks_ms():
+    harness.clock.Check()
+    return (harness.clock.Us() // 1000) & (_TICKS_PERIOD - 1)
+
+def ticks_cpu():
+    return ticks_us()
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & (_TICKS_PERIOD - 1)
+
+def ticks_diff(a, b):
+    return ((a - b + (_TICKS_PERIOD >> 1)) & (_TICKS_PERIOD - 1)) - (_TICKS_PERIOD >> 1)
+
+def sleep(s):
+    harness.OnSleep(int(s * 1000000))
+
+def sleep_ms(ms):
+    harness.OnSleep(int(ms * 1000))
+
+def sleep_us(us):
+    harness.OnSleep(int(us))
+
+def time():
+    # MicroPython's epoch is 2000-01-01
+    return int(_time.time()) - _EPOCH_2000
+
+def time_ns():
+    return _time.time_ns()
+
+def localtime(secs=None):
+    if secs is None:
+        secs = time()
+    return _time.localtime(secs + _EPOCH_2000)[:8]
+
+def Install():
+    # The real time module is built in, so it can't be shadowed on sys.path; patch it instead
+    for name in ("ticks_us", "ticks_ms", "ticks_cpu", "ticks_add", "ticks_diff",
+                 "sleep", "sleep_ms", "sleep_us"):
+        setattr(_time, name, globals()[name])
@@ -0,0 +1,23 @@
+# PithOS host emulator - stand-in for the vga2_16x32 bitmap font
+# Built at import time by pixel-doubling the 8x16 stand-in
+import vga2_8x16 as _small
+
+WIDTH = 16
+HEIGHT = 32
+FIRST = 0x00
+LAST = 0xff
+
+def _Double(src):
+    out = bytearray()
+    for b in src:
+        wide = 0
+        for bit in range(8):
+            if b & (0x80 >> bit):
+                wide |= 0xC000 >> (bit * 2)
+        row = bytes((wide >> 8, wide & 0xFF))
+        out += row
+        out += row
+    return bytes(out)
+
+_FONT = _Double(_small._FONT)
+FONT = memoryview(_FONT)
@@ -1,13 +1,11 @@
 # This program is ported from a normal python program I made a few years ago
 # I made this in conjuction with textbox.py so I can easily port my text-based python games to the Pico
 
-#TODO:
-#screen slowly turns black when you pass out
-
 from machine import Pin, SPI
 import st7789
 import vga2_8x16 as font8
-from atomic import Pressed, CreateTextBox, Print, Flush
+from atomic import Pressed, CreateTextBox, Print, Flush, DrawTextBox
+from atomic import transitions
 
 from random import random, choice, randint
 from time import sleep
@@ -428,10 +426,17 @@ def EndGame():
     Print(flush=False)
     Print(f"Your final score is: {reputation}")
 
+def RenderScreen(strip, y):
+    strip.fill(WHITE)
+    DrawTextBox(strip, y)
+
 def Hospitalised():
     global finished
     Print(flush=False)
-    s(5)
+    transitions.FadeOut(display, RenderScreen, BLACK, 16, 0 if devMode else 0.15) #screen slowly turns black as you pass out
+    s(3)
+    transitions.FadeIn(display, RenderScreen, BLACK, 8, 0 if devMode else 0.05)
+    s(1)
     Print("You collapsed from alcohol poisoning and were taken to hospital")
     s(3)
     Print("You embarrassed yourself and your parents more than they even thought possible")
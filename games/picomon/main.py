@@ -2,13 +2,20 @@ from machine import Pin, SPI
 import st7789
 import vga2_16x32 as font16
 import vga2_8x16 as font8
-from time import sleep, ticks_us
+from time import sleep, ticks_us, ticks_ms, ticks_add
 from random import random, randint, choice, uniform
-import os
-import framebuf
 
-from atomic import graphics, tileutils, utilities
+from atomic import graphics, utilities, transitions, assets
 from atomic import Pressed
+from atomic.spritecache import SpriteCache
+from atomic.viewport import RenderTiles
+from atomic.world import World
+from atomic.tileanim import TileAnimator
+from atomic.atlas import Atlas
+from atomic.pack import Pack
+from atomic.frozen import FrozenPack
+from atomic.particles import Particles
+from atomic.animator import Animator, ONCE
 
 spi = SPI(1, baudrate=60000000, polarity=1, phase=1,
           sck=Pin(10), mosi=Pin(11))
@@ -43,6 +50,11 @@ WHITE = graphics.RGBto565(255, 255, 255)
 GRASS = graphics.RGBto565(111, 191, 79)
 
 bufferArray = bytearray(32 * 32 * 2)
+hitSparks = Particles(32, 0.4, 4) #thrown off a picomon when an attack lands
+attackAnimator = Animator() #no atlas, the frames are just names handled by AnimateAttack
+attackAnimator.Add("lunge", ("lunge", "rest"), (100, 50), ONCE)
+attackAnimator.Add("hit", ("flash", "still") * 3, 50, ONCE)
+spriteCache = SpriteCache(3 * 96 * 96 * 2) #room for three 16x16 sprites at scale 6, e.g. both fighters and a flash
 
 def LoadGameInfo():
     with open("info.info", "r") as f:
@@ -51,35 +63,22 @@ def LoadGameInfo():
 gameInfo = LoadGameInfo()
 version = f"v{gameInfo['version']}"
 
-def LoadBiome(path):
-    with open(path, "r") as f:
-        return [list(line.strip()) for line in f if line.strip()]
-
-def LoadTile(path):
-    with open(path, "rb") as f:
-        return bytearray(f.read())
-
-def BlitTile(tile, x, y, slow=False):
-    display.blit_buffer(tile, x, y, 16, 16)
-    if slow:
-        sleep(0.01)
-
-def DrawTilemap(tilemap, slow=False):
+def DrawTilemap(tilemap):
+    # One blit per row of tiles rather than one per tile
     tileSize = 16
-    for row in range(15):
-        for col in range(15):
-            if 0 <= row < len(tilemap) and 0 <= col < len(tilemap[0]):
-                char = tilemap[row][col]
-                tile = tileset.get(char)
-                if tile:
-                    drawX = col * tileSize
-                    drawY = row * tileSize
-                    BlitTile(tile, drawX, drawY, slow)
+    strip = bytearray(240 * tileSize * 2)
+    for y in range(0, 240, tileSize):
+        RenderTiles(strip, 240, tileSize, tilemap, tileset, 0, y)
+        display.blit_buffer(strip, 0, y, 240, tileSize)
+
+def DrawTilemapStrip(tilemap, strip, y):
+    # Renders screen rows y onwards of the tilemap into a transition strip
+    RenderTiles(strip.buf, strip.width, strip.height, tilemap, tileset, 0, y)
 
 def GetPlayerTile(tilemap, x, y):
-    tx, ty = tileutils.GetTileCoords(x, y, 16)
-    if 0 <= ty < len(tilemap) and 0 <= tx < len(tilemap[0]):
-        return tilemap[ty][tx]
+    tile = tilemap.At(x, y)
+    if tile >= 0:
+        return chr(tile)
     return None
 
 def GetCoveredTileCoords(x, y, radius):
@@ -101,39 +100,41 @@ def DrawPlayerBuffered(x, y, tilemap):
 
     for dy in range(2):
         for dx in range(2):
-            tx = tileLeft + dx
-            ty = tileTop + dy
-            if 0 <= ty < len(tilemap) and 0 <= tx < len(tilemap[0]):
-                tileChar = tilemap[ty][tx]
-                tile = preRenderedTiles.get(tileChar)
-                if tile:
-                    graphics.BlitTileToBuffer(tile, buf, dx * 16, dy * 16)
+            tile = preRenderedTiles.get(tilemap.Get(tileLeft + dx, tileTop + dy))
+            if tile:
+                graphics.BlitRect(tile, 16, 16, buf, 32, 32, dx * 16, dy * 16)
 
-    with open("assets/other/player.tile", "rb") as f:
-        spriteData = f.read()
-
-    graphics.BlitTransparentSprite(spriteData, buf, 32, offsetX, offsetY, 16, 16, WHITE)
+    graphics.BlitSpans(playerSpans, buf, 32, 32, offsetX, offsetY)
 
     display.blit_buffer(bufferArray, x - offsetX, y - offsetY, 32, 32)
 
-tileset = {}
+try:
+    import picomon_assets #only there if frozen into the firmware (tools/freeze.py); read in place from flash
+    pack = FrozenPack(picomon_assets)
+except ImportError:
+    pack = Pack("assets.pak") #every asset in one file, opened once and read with seeks
 
-for filename in os.listdir("assets/tiles"):
-    if filename.endswith(".tile"):
-        name = filename[:-5] #remove '.tile'
-        # Strip trailing underscores from tile names
-        name = name.rstrip('_')
-        tileData = LoadTile("assets/tiles/" + filename)
-        if name == "grass":
-            tileset["."] = tileData
-        else:
-            tileset[name] = tileData
+overworldAtlas = Atlas(assets.Pin("overworld.atl", pack)) #every overworld tile plus the player, in one read
 
-fieldTilemap = LoadBiome("assets/tilemaps/field.tm")
+playerSpans = graphics.CompileSpans(overworldAtlas["player"], 16, 16, WHITE) #only the opaque pixels, drawn without per-pixel checks
 
-preRenderedTiles = {}
-for char, tile in tileset.items():
-    preRenderedTiles[char] = tile
+tileset = {name: overworldAtlas[name] for name in overworldAtlas.names if name != "player"}
+
+world = World("tilemaps/world.wld", pack=pack) #grid of screen-sized biome chunks, loaded as the player nears them
+fieldTilemap = world.Chunk(0, 0)
+tileset = fieldTilemap.Tileset(tileset) #keyed by tile ID rather than character
+
+def TintTile(tile, color, weight):
+    tinted = bytearray(tile)
+    graphics.BlendBuffer(tinted, 16 * 16, graphics.BlendLUT(color, weight))
+    return tinted
+
+tileAnimator = TileAnimator(tileset)
+tileAnimator.Add("r", [TintTile(tileset[ord("r")], 0xFFFF, w) for w in (0, 0.1, 0.2, 0.1)], 400, world) #water shimmers
+tileAnimator.Add("X", [TintTile(tileset[ord("X")], graphics.RGBto565(255, 0, 0), w) for w in (0, 0.15, 0.3, 0.15)], 250, world) #boss tile pulses red
+tileset = tileAnimator.tiles #always holds the current frame of every tile
+
+preRenderedTiles = tileset
 
 baseLvl = 10
 types = ("Fire", "Grass", "Electric", "Water", "Dark")
@@ -175,6 +176,9 @@ tileChances = {
     "X": [1, [0,0,0,0]]
 }
 
+for tileType, (rate, weights) in tileChances.items():
+    world.SetProps(tileType, rate=rate)
+
 class Picomon:
     def __init__(self, name, desc, pType, hp, moves, level):
         self.name    = name
@@ -346,11 +350,17 @@ def CalculatePowerRating(speciesName):
     return int(round(powerRating, 0))
 
 def LoadPicomonSprites():
-    for filename in os.listdir("assets/picomon"):
-        if filename.endswith(".tile"):
-            name = filename[:-5] #remove '.tile'
-            if name in speciesRegistry:
-                speciesRegistry[name]["sprite"] = LoadTile("assets/picomon/" + filename)
+    sprites = Atlas(assets.Pin("picomon.atl", pack)) #frames are named after the species, lowercase
+    for name in speciesRegistry:
+        sprite = sprites.Get(name.lower())
+        if sprite is not None:
+            speciesRegistry[name]["sprite"] = sprite
+
+def GetSprite(picomon):
+    sprite = speciesRegistry.get(picomon.name, {}).get("sprite")
+    if sprite is None or len(sprite) != 16 * 16 * 2:
+        return None
+    return sprite
 
 def DrawText(font, msg, x, y, fg, bg, jx=0, jy=0):
     utilities.DrawText(display, font, msg, x, y, fg, bg, jx, jy)
@@ -462,115 +472,44 @@ def DrawPicomonInfo(pico, x, y=5):
     DrawText(font8, f"Lvl {pico.level}", x, y + 16, BLACK, WHITE)
     DrawText(font8, f"{pico.hp}/{pico.maxHp}hp", x, y + 32, BLACK, WHITE)
 
-def DrawPicomon(picomon, x, flip=False, y=75, scale=6):
-    path = f"assets/picomon/{picomon.name.lower()}.tile"
-    try:
-        with open(path, "rb") as f:
-            data = f.read()
-    except OSError:
-        return
-
-    width = height = 16
-    expectedLength = width * height * 2
+def DrawScaledSprite(spriteData, x, y, scale, flip):
+    size = 16 * scale
+    display.blit_buffer(spriteCache.Scaled(spriteData, 16, 16, scale, flip), x, y, size, size)
 
-    if len(data) != expectedLength:
+def DrawPicomon(picomon, x, flip=False, y=75, scale=6):
+    spriteData = GetSprite(picomon)
+    if spriteData is None:
         return
-
-    for row in range(height):
-        for col in range(width):
-            # If flipping, read pixels from the mirrored column
-            draw_col = width - 1 - col if flip else col
-            i = 2 * (row * width + draw_col)
-            color = (data[i] << 8) | data[i + 1]
-
-            sx = x + col * scale
-            sy = y + row * scale
-            display.fill_rect(sx, sy, scale, scale, color)
-
-def ConvertRGB565ToTileset(data, width, height, name):
-    tile_w, tile_h = 16, 16
-    tiles_x = width // tile_w
-    tiles_y = height // tile_h
-
-    os.makedirs("assets/picomon", exist_ok=True)
-
-    def tile_id(i):
-        s = ''
-        while True:
-            s = chr(97 + (i % 26)) + s
-            i //= 26
-            if i == 0:
-                break
-        return s
-
-    tilemap_lines = []
-    tile_count = 0
-
-    for ty in range(tiles_y):
-        line = []
-        for tx in range(tiles_x):
-            tile_name = tile_id(tile_count)
-            tile_count += 1
-            line.append(tile_name)
-
-            tile_data = bytearray()
-            for row in range(tile_h):
-                for col in range(tile_w):
-                    px = tx * tile_w + col
-                    py = ty * tile_h + row
-                    i = 2 * (py * width + px)
-                    tile_data.append(data[i])
-                    tile_data.append(data[i+1])
-
-            with open(f"assets/picomon/{tile_name}.tile", "wb") as f:
-                f.write(tile_data)
-
-        tilemap_lines.append(" ".join(line))
-
-    with open(f"assets/picomon/{name.lower()}.tm", "w") as f:
-        f.write("\n".join(tilemap_lines))
-
-def BlendRGB565Slow(original, flash, weight=0.5): #atomic engine has an optimisation for this, but I prefer the look of this slower version
-    # Extract RGB565 channels
-    r1 = (original >> 11) & 0x1F
-    g1 = (original >> 5)  & 0x3F
-    b1 = original & 0x1F
-
-    r2 = (flash >> 11) & 0x1F
-    g2 = (flash >> 5)  & 0x3F
-    b2 = flash & 0x1F
-
-    # Convert to 8-bit
-    r1 = int(r1 * 255 / 31)
-    g1 = int(g1 * 255 / 63)
-    b1 = int(b1 * 255 / 31)
-
-    r2 = int(r2 * 255 / 31)
-    g2 = int(g2 * 255 / 63)
-    b2 = int(b2 * 255 / 31)
-
-    # Weighted average
-    w = weight
-    r = int(r1 * (1 - w) + r2 * w)
-    g = int(g1 * (1 - w) + g2 * w)
-    b = int(b1 * (1 - w) + b2 * w)
-
-    # Back to RGB565
-    return graphics.RGBto565(r, g, b)
+    DrawScaledSprite(spriteData, x, y, scale, flip)
 
 def FlashSprite(spriteData, x, y, scale=6, flashColor=WHITE, flip=False):
-    width = height = 16
-    for row in range(height):
-        for col in range(width):
-            draw_col = width - 1 - col if flip else col
-            i = 2 * (row * width + draw_col)
-            color = (spriteData[i] << 8) | spriteData[i + 1]
-
-            if color != WHITE:
-                blended = BlendRGB565Slow(color, flashColor, 0.75) #intentionally not using atomic engine here because of visual preference
-                sx = x + col * scale
-                sy = y + row * scale
-                display.fill_rect(sx, sy, scale, scale, blended)
+    def Build():
+        flashed = bytearray(spriteData)
+        graphics.BlendBuffer(flashed, 16 * 16, graphics.BlendLUT(flashColor, 0.75), WHITE) #blends towards the flash colour in 8-bit per channel, whole sprite in one pass
+
+        scaled = bytearray(size * size * 2)
+        graphics.ScaleSprite(flashed, scaled, 16, 16, scale, flip)
+        return scaled
+
+    size = 16 * scale
+    buf = spriteCache.Get((id(spriteData), scale, flip, flashColor), Build)
+    display.blit_buffer(buf, x, y, size, size)
+
+def HitSparks(picomon, x, flip, color, y=75, scale=6):
+    # Sparks thrown off the defender, composited over its sprite so each frame is a single blit
+    spriteData = GetSprite(picomon)
+    if spriteData is None:
+        return
+    size = 16 * scale
+    sprite = spriteCache.Scaled(spriteData, 16, 16, scale, flip)
+    frame = bytearray(size * size * 2)
+    hitSparks.Burst(x + size // 2, y + size // 2, 32, 5, 8, (color, BLACK), 1)
+    while hitSparks.Update():
+        frame[:] = sprite
+        hitSparks.Draw(frame, size, size, x, y)
+        display.blit_buffer(frame, x, y, size, size)
+        sleep(0.03)
+    display.blit_buffer(sprite, x, y, size, size)
 
 def AnimateAttack(attacker, defender, moveType, playerAttacking, attackerX, defenderX):
     if playerAttacking:
@@ -583,29 +522,29 @@ def AnimateAttack(attacker, defender, moveType, playerAttacking, attackerX, defe
 
     flashColor = typeColour.get(moveType, WHITE)
 
-    display.fill_rect(attackerX, 75, 96, 96, WHITE)
-    DrawPicomon(attacker, attackerX + offset, flipped)
-    sleep(0.1)
-
-    display.fill_rect(attackerX + offset, 75, 96, 96, WHITE)
-    DrawPicomon(attacker, attackerX, flipped)
-    #sleep(0.05)
-
-    spritePath = f"assets/picomon/{defender.name.lower()}.tile"
-    try:
-        with open(spritePath, "rb") as f:
-            spriteData = f.read()
-    except:
-        spriteData = None
+    spriteData = GetSprite(defender)
+
+    #both fighters run off the same clock, the hit starting as the attacker springs back; only a
+    #sprite whose frame has changed gets redrawn, and a slow redraw doesn't stretch the animation
+    now = ticks_ms()
+    attackAnimator.Play("attacker", "lunge", now, True)
+    attackAnimator.Play("defender", "hit", ticks_add(now, 100), True)
+    while not (attackAnimator.Done("attacker") and attackAnimator.Done("defender")):
+        if attackAnimator.Update(ticks_ms()):
+            if attackAnimator.Changed("attacker"):
+                lunging = attackAnimator.Frame("attacker") == "lunge"
+                display.fill_rect(attackerX + (0 if lunging else offset), 75, 96, 96, WHITE)
+                DrawPicomon(attacker, attackerX + (offset if lunging else 0), flipped)
+            if attackAnimator.Changed("defender"):
+                if attackAnimator.Frame("defender") == "still":
+                    DrawPicomon(defender, defenderX, antiFlip)
+                elif spriteData:
+                    FlashSprite(spriteData, defenderX, 75, 6, flashColor, flip=antiFlip)
+                else:
+                    display.fill_rect(defenderX, 75, 96, 96, flashColor)
+        sleep(0.005)
 
-    for _ in range(3):
-        if spriteData:
-            FlashSprite(spriteData, defenderX, 75, 6, flashColor, flip=antiFlip)
-        else:
-            display.fill_rect(defenderX, 75, 96, 96, flashColor)
-        sleep(0.05)
-        DrawPicomon(defender, defenderX, antiFlip)
-        sleep(0.05)
+    HitSparks(defender, defenderX, antiFlip, flashColor)
 
 def CalculateDamage(attacker, defender, move):
     basePower = move[1]
@@ -872,6 +811,14 @@ playerY = 216
 size = 8 #player radius
 speed = 1 #player speed
 
+def EnterChunk(dx, dy):
+    global chunkX, chunkY, currentBiome
+    chunkX += dx
+    chunkY += dy
+    currentBiome = world.Chunk(chunkX, chunkY)
+    DrawTilemap(currentBiome)
+
+chunkX = chunkY = 0
 currentBiome = fieldTilemap
 LoadPicomonSprites()
 DrawTilemap(currentBiome)
@@ -888,15 +835,27 @@ while True:
     if Pressed(iDown):  playerY += speed; moved = True
     if Pressed(iLeft):  playerX -= speed; moved = True
     if Pressed(iRight): playerX += speed; moved = True
-    playerX = min(max(playerX, 0), 240)
-    playerY = min(max(playerY, 0), 240)
+
+    # Walking off the screen moves to the next chunk of the world, if there is one
+    if playerX < 0 and world.Has(chunkX - 1, chunkY):
+        EnterChunk(-1, 0); playerX += 240
+    elif playerX >= 240 and world.Has(chunkX + 1, chunkY):
+        EnterChunk(1, 0); playerX -= 240
+    if playerY < 0 and world.Has(chunkX, chunkY - 1):
+        EnterChunk(0, -1); playerY += 240
+    elif playerY >= 240 and world.Has(chunkX, chunkY + 1):
+        EnterChunk(0, 1); playerY -= 240
+    playerX = min(max(playerX, 0), 239) #240 would be the next chunk's first pixel
+    playerY = min(max(playerY, 0), 239)
 
     if moved:
+        world.Update(chunkX * 240 + playerX, chunkY * 240 + playerY) #page in neighbouring chunks near an edge, drop the rest
         DrawPlayerBuffered(playerX, playerY, currentBiome)
 
     if any(Pressed(btn) for btn in (iUp, iDown, iLeft, iRight)):
         tileType = GetPlayerTile(currentBiome, playerX, playerY)
-        if tileType in tileChances and random() <= tileChances[tileType][0]:
+        rate = currentBiome.RateAt(playerX, playerY)
+        if rate and random() <= rate:
             battled = True
             if tileType == "X":
                 Battle([NewPicomon("Poulter", 20)])
@@ -907,9 +866,14 @@ while True:
                 weights = tileChances[tileType][1]
                 enemies = [NewPicomon(ChooseSpeciesByType(weights)) for _ in range(enemyCount)]
                 Battle(enemies)
-            DrawTilemap(currentBiome, True)
+            transitions.Dissolve(display, lambda strip, y: DrawTilemapStrip(currentBiome, strip, y), 16, 15, 0.03)
             DrawPlayerBuffered(playerX, playerY, currentBiome)
 
+    if tileAnimator.Update(ticks_ms()):
+        tileAnimator.Draw(display, currentBiome, skip=(playerX - playerX % 16, playerY - playerY % 16, 32, 32))
+        if tileAnimator.skipped:
+            DrawPlayerBuffered(playerX, playerY, currentBiome) #composites the changed tiles under the player, so they don't flicker over it
+
     if debug:
         if battled:
             frameStart = ticks_us()
@@ -5,6 +5,9 @@ import vga2_16x32 as font16
 import vga2_8x16 as font8
 from random import randint, choice
 
+from atomic.compositor import Compositor
+from atomic.particles import Particles
+
 spi = SPI(1, baudrate=60000000, polarity=1, phase=1,
           sck=Pin(10), mosi=Pin(11))
 
@@ -51,12 +54,12 @@ version = f"v{gameInfo['version']}"
 def Pressed(pin):
     return pin.value() == 0
 
-def DrawText(font_module, msg, x, y, colour, jx=0, jy=0):
+def DrawText(font_module, msg, x, y, colour, jx=0, jy=0, target=display):
     w = len(msg) * font_module.WIDTH
     h = font_module.HEIGHT
     ax = int(x - w * jx)
     ay = int(y - h * jy)
-    display.text(font_module, msg, ax, ay, colour)
+    target.text(font_module, msg, ax, ay, colour)
 
 class Object: #square object with position, size, speed, and subpixel pos, in each dimension
     def __init__(self, x, y, rx, ry, dx, dy):
@@ -80,7 +83,7 @@ class Mode:
         self.ballSpeedIncrease = ballSpeedIncrease
         self.paddleSpeedIncrease = paddleSpeedIncrease
         self.scoreIncrease = scoreIncrease
-        self.colour = colour #currently unused
+        self.colour = colour #only used for the paddle sparks
 
 def CheckPaddle(paddle):
     if not (Pressed(iLeft) == Pressed(iRight)):
@@ -132,7 +135,15 @@ def PaddleCollision(ball, paddle):
         return 0
 
 def DrawObject(obj, colour=WHITE):
-    display.fill_rect(obj.x-obj.rx, obj.y-obj.ry, obj.rx * 2, obj.ry * 2, colour)
+    frame.fill_rect(obj.x-obj.rx, obj.y-obj.ry, obj.rx * 2, obj.ry * 2, colour)
+
+def DrawSparks(colour=None):
+    # Sparks are drawn straight into the compositor's buffer; passing the background colour erases them
+    if colour is None:
+        sparks.Draw(frame.surface.buf, 240, 240)
+    else:
+        sparks.Draw(frame.surface.buf, 240, 240, 0, 0, colour)
+    frame.Damage(*sparks.Bounds())
 
 def ShowFPS(lastFrameStart):
     frametime = ticks_us() - lastFrameStart
@@ -151,6 +162,10 @@ def DetermineMode(btn):
     return mode
 
 
+frame = Compositor(display) #the main scene is drawn off-screen and only the changed areas are sent each frame
+sparks = Particles(64, 0.1, 2) #thrown off the paddle when it hits the ball
+modeColours = {"WHITE": WHITE, "RED": RED, "PURPLE": PURPLE, "BLUE": BLUE}
+
 scene = "Start"
 gameTime = ticks_us()
 targetFps = 60
@@ -172,21 +187,30 @@ while True:
                 while Pressed(pressedButton):
                     sleep(0.001)
                 scene = "Main"
-                display.fill(BLACK)
+                sparks.Clear()
+                frame.fill(BLACK)
+                frame.Flush()
 
     elif scene == "Main":
         CheckPaddle(paddle)
         DrawObject(ball, BLACK) #draw over the previous positions in black to erase
         DrawObject(paddle, BLACK)
+        DrawSparks(BLACK)
         MoveObject(ball)
         MoveObject(paddle)
         scene = CheckDeath(ball) #must be put between moving and edge-checking
         Bounce(ball)
         Bounce(paddle)
-        points += PaddleCollision(ball, paddle)
+        gained = PaddleCollision(ball, paddle)
+        if gained:
+            points += gained
+            sparks.Burst(ball.x, ball.y + ball.ry, 16, 2.5, 20, (modeColours[mode.colour], WHITE), 1)
+        if sparks.Update():
+            DrawSparks()
         DrawObject(ball)
         DrawObject(paddle)
-        DrawText(font8, str(points), 4, 2, WHITE)
+        DrawText(font8, str(points), 4, 2, WHITE, target=frame)
+        frame.Flush()
         #ShowFPS(frameStart) #optional for debug
         if scene == "Game Over":
             display.fill(BLACK)
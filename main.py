@@ -10,6 +10,7 @@ import vga2_8x16 as font8
 
 from atomic import utilities, Pressed, RGBto565, WrapText, CreateTextBox, Print
 from atomic import __version__ as atomicVersion
+from atomic import displayproxy
 
 spi = SPI(1, baudrate=60000000, polarity=1, phase=1,
           sck=Pin(10), mosi=Pin(11))
@@ -45,7 +46,7 @@ WHITE = RGBto565(255, 255, 255)
 GREY  = RGBto565(215, 215, 215)
 
 sys.path.append("/")
-version = "v1.6"
+version = "v1.7"
 
 DEBUG = False ###
 
@@ -214,6 +215,13 @@ def RunMenu(games):
 
         sleep(0.01)
 
+def UsesBatchDraw():
+    try:
+        meta = eval(open("info.info").read())
+        return bool(int(meta.get("batchDraw", 0)))
+    except:
+        return False
+
 def Launch(path): 
     # Clean up launcher memory before starting game
     global gameList  # This could all be made more efficient with less overhead if needed
@@ -224,17 +232,23 @@ def Launch(path):
         gameDir = "/".join(path.split("/")[:-1])
         originalDir = os.getcwd()
         os.chdir(gameDir)
+
+        # Games can opt in to having their draw calls batched and flushed once per frame
+        if UsesBatchDraw():
+            displayproxy.Install()
         
         # Execute directly without storing code string in memory
         with open("main.py") as f:
             exec(f.read(), {})
         
+        displayproxy.Uninstall()
         os.chdir(originalDir)
 
     except KeyboardInterrupt:
         #display.fill(BLACK)
         raise  # Exit the game cleanly on keyboard interrupt
     except Exception as e:
+        displayproxy.Uninstall()
         display.fill(WHITE)
         CreateTextBox(
             display=display,
@@ -0,0 +1,331 @@
+# PithOS asset pipeline
+# Copyright (c) 2026 Henry Gurney
+# Licensed under CC BY-NC-ND 4.0
+
+# Builds every runtime asset a game needs from the sources listed in its assets.json, on the
+# computer rather than on the handheld. Each asset is keyed on a hash of its manifest entry and
+# source files, so only assets whose sources changed are rebuilt, and those are built in parallel
+#
+#   python tools/build.py picomon            # build games/picomon/assets.json
+#   python tools/build.py picomon --force    # ignore the cache
+#   python tools/build.py --all -j 8
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "emulator")) # stand-in micropython module for atomic
+sys.path.insert(1, ROOT)
+
+from atomic import indexed
+from atomic.atlas import EncodeAtlas
+from atomic.frozen import FreezeAssets
+from atomic.pack import Pack, SavePack
+
+PIPELINE_VERSION = "2" # bump when a builder's output changes, to invalidate every cached asset
+CACHE_DIR = os.path.join(ROOT, "tools", ".cache")
+WHITE = 0xFFFF
+
+# Images
+
+def ReadPNG(path):
+    # Non-interlaced 8-bit PNGs -> (width, height, [(r, g, b, a), ...])
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError(path + " is not a PNG")
+    pos = 8
+    idat = b""
+    palette = []
+    alphas = b""
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        if kind == b"IHDR":
+            width, height, depth, colorType, _, _, interlace = struct.unpack(">IIBBBBB", body)
+        elif kind == b"PLTE":
+            palette = [tuple(body[i:i + 3]) for i in range(0, len(body), 3)]
+        elif kind == b"tRNS":
+            alphas = body
+        elif kind == b"IDAT":
+            idat += body
+        pos += 12 + length
+    if depth != 8 or interlace:
+        raise ValueError(path + ": only non-interlaced 8-bit PNGs are supported")
+
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[colorType]
+    stride = width * channels
+    raw = zlib.decompress(idat)
+    rows = []
+    prev = bytearray(stride)
+    pos = 0
+    for _ in range(height):
+        kind = raw[pos]
+        row = bytearray(raw[pos + 1:pos + 1 + stride])
+        pos += 1 + stride
+        for i in range(stride):
+            a = row[i - channels] if i >= channels else 0
+            b = prev[i]
+            c = prev[i - channels] if i >= channels else 0
+            if kind == 1:
+                row[i] = (row[i] + a) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + b) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + ((a + b) >> 1)) & 0xFF
+            elif kind == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                row[i] = (row[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+        rows.append(row)
+        prev = row
+
+    pixels = []
+    for row in rows:
+        for x in range(width):
+            p = row[x * channels:(x + 1) * channels]
+            if colorType == 0:
+                pixels.append((p[0], p[0], p[0], 255))
+            elif colorType == 2:
+                pixels.append((p[0], p[1], p[2], 255))
+            elif colorType == 3:
+                pixels.append(palette[p[0]] + (alphas[p[0]] if p[0] < len(alphas) else 255,))
+            elif colorType == 4:
+                pixels.append((p[0], p[0], p[0], p[1]))
+            else:
+                pixels.append(tuple(p))
+    return width, height, pixels
+
+def ToRGB565(pixels, trans=WHITE):
+    # Panel (big-endian) order; pixels under half opaque become the transparent colour
+    out = bytearray(len(pixels) * 2)
+    for i, (r, g, b, a) in enumerate(pixels):
+        c = trans if a < 128 else ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        out[2 * i] = c >> 8
+        out[2 * i + 1] = c & 0xFF
+    return out
+
+def LoadImage(path, spec):
+    # Any image source -> (RGB565 pixels, width, height)
+    if path.endswith(".png"):
+        w, h, pixels = ReadPNG(path)
+        return ToRGB565(pixels, spec.get("trans", WHITE)), w, h
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".pic"):
+        magic, w, h, fmt, _ = struct.unpack("<4sHHBI", data[:13])
+        if magic != b"PICO" or fmt != 1:
+            raise ValueError(path + " is not an RGB565 picture")
+        return data[16:16 + w * h * 2], w, h
+    w, h = spec.get("size", (16, 16)) # raw RGB565, e.g. .tile
+    if len(data) != w * h * 2:
+        raise ValueError(f"{path} is {len(data)} bytes, not {w}x{h} RGB565")
+    return data, w, h
+
+# Builders; each takes a manifest entry and the game folder and returns [(name, data), ...]
+
+def Sources(spec, game):
+    # The entry's source files, with globs expanded, in a stable order
+    found = []
+    for src in ([spec["src"]] if "src" in spec else []) + [f if isinstance(f, str) else f["src"]
+                                                            for f in spec.get("frames", [])]:
+        matches = sorted(glob.glob(os.path.join(game, src)))
+        if not matches:
+            raise FileNotFoundError(f"{spec['name']}: no source matches {src}")
+        for path in matches:
+            if os.path.isdir(path): # e.g. a font's folder of glyphs
+                found += sorted(os.path.join(path, f) for f in os.listdir(path))
+            else:
+                found.append(path)
+    return found
+
+def BuildCopy(spec, game):
+    with open(os.path.join(game, spec["src"]), "rb") as f:
+        return [(spec["name"], f.read())]
+
+def BuildTile(spec, game):
+    return [(spec["name"], bytes(LoadImage(os.path.join(game, spec["src"]), spec)[0]))]
+
+def BuildAtlas(spec, game):
+    frames = []
+    for frame in spec["frames"]:
+        if isinstance(frame, str): # a path or glob; frames are named after the files
+            for path in sorted(glob.glob(os.path.join(game, frame))):
+                name = os.path.splitext(os.path.basename(path))[0]
+                frames.append((name,) + tuple(LoadImage(path, spec)))
+        else:
+            frames.append((frame["name"],) + tuple(LoadImage(os.path.join(game, frame["src"]), spec)))
+    return [(spec["name"], EncodeAtlas(frames))]
+
+def BuildTilemap(spec, game):
+    # Trailing spaces and blank lines dropped, so the map is exactly what LoadTilemap will see
+    with open(os.path.join(game, spec["src"]), "rb") as f:
+        lines = [line.rstrip() for line in f.read().split(b"\n")]
+    return [(spec["name"], b"\n".join(line for line in lines if line) + b"\n")]
+
+def BuildIndexed(spec, game):
+    pixels, w, h = LoadImage(os.path.join(game, spec["src"]), spec)
+    image = indexed.Encode(pixels, w, h, spec.get("bpp", 0), spec.get("trans", -1))
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "image.ix")
+        image.Save(path)
+        with open(path, "rb") as f:
+            return [(spec["name"], f.read())]
+
+def BuildPic(spec, game):
+    # Pico Pix's RGB565 picture format
+    pixels, w, h = LoadImage(os.path.join(game, spec["src"]), spec)
+    header = struct.pack("<4sHHBI", b"PICO", w, h, 1, spec.get("timestamp", 0)) + b"\x00" * 3
+    return [(spec["name"], header + bytes(pixels))]
+
+def BuildTileset(spec, game):
+    # Cuts a picture into tiles: an atlas of the distinct tiles, named a, b, ... z, ba, ...,
+    # and a text map of tile names (one row of tiles per line) to put the picture back together
+    pixels, w, h = LoadImage(os.path.join(game, spec["src"]), spec)
+    tw, th = spec.get("tile", (16, 16))
+    frames = []
+    seen = {}
+    lines = []
+    for ty in range(h // th):
+        line = []
+        for tx in range(w // tw):
+            tile = b"".join(pixels[((ty * th + row) * w + tx * tw) * 2:((ty * th + row) * w + (tx + 1) * tw) * 2]
+                            for row in range(th))
+            name = seen.get(tile)
+            if name is None:
+                i = len(frames)
+                name = ""
+                while True:
+                    name = chr(97 + i % 26) + name
+                    i //= 26
+                    if not i:
+                        break
+                seen[tile] = name
+                frames.append((name, tile, tw, th))
+            line.append(name)
+        lines.append(" ".join(line))
+    return [(spec["name"], EncodeAtlas(frames)), (spec["map"], ("\n".join(lines) + "\n").encode())]
+
+def BuildFont(spec, game):
+    # A folder of glyph PNGs named by character code in hex (41.png is "A") -> a font module
+    # for the st7789 driver, like the_1_dollar_watt/symbols_8x16.py
+    w, h = spec.get("size", (8, 16))
+    first = spec.get("first", 0x20)
+    last = spec.get("last", 0x7E)
+    light = spec.get("ink", "dark") == "light"
+    rowBytes = (w + 7) // 8
+    folder = os.path.join(game, spec["src"])
+    font = bytearray()
+    for code in range(first, last + 1):
+        glyph = bytearray(rowBytes * h)
+        path = os.path.join(folder, f"{code:02x}.png")
+        if os.path.exists(path):
+            gw, gh, pixels = ReadPNG(path)
+            for y in range(min(h, gh)):
+                for x in range(min(w, gw)):
+                    r, g, b, a = pixels[y * gw + x]
+                    luma = (77 * r + 150 * g + 29 * b) >> 8
+                    if a >= 128 and (luma >= 128) == light:
+                        glyph[y * rowBytes + x // 8] |= 0x80 >> (x & 7)
+        font += glyph
+    text = (f"# Auto-generated font from PNGs in {spec['src']}\nWIDTH = {w}\nHEIGHT = {h}\n"
+            f"FIRST = 0x{first:02x}\nLAST = 0x{last:02x}\n_FONT = {bytes(font)!r}\nFONT = memoryview(_FONT)\n")
+    return [(spec["name"], text.encode())]
+
+BUILDERS = {
+    "copy": BuildCopy,
+    "tile": BuildTile,
+    "atlas": BuildAtlas,
+    "tilemap": BuildTilemap,
+    "indexed": BuildIndexed,
+    "pic": BuildPic,
+    "tileset": BuildTileset,
+    "font": BuildFont,
+}
+
+# Incremental builds
+
+def Hash(spec, game):
+    h = hashlib.sha256((PIPELINE_VERSION + json.dumps(spec, sort_keys=True)).encode())
+    for path in Sources(spec, game):
+        h.update(os.path.relpath(path, game).encode())
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+def Build(spec, game, key):
+    # Runs in a worker process; results are cached as a pack under the entry's hash
+    outputs = BUILDERS[spec["type"]](spec, game)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, key + ".pak")
+    SavePack(path + ".tmp", outputs)
+    os.replace(path + ".tmp", path)
+    return key
+
+def Cached(key):
+    path = os.path.join(CACHE_DIR, key + ".pak")
+    if not os.path.exists(path):
+        return None
+    pack = Pack(path)
+    outputs = [(name, bytes(pack.Read(name))) for name in pack.Names()]
+    pack.Close()
+    return outputs
+
+def BuildGame(name, jobs=None, force=False):
+    game = os.path.join(ROOT, "games", name)
+    with open(os.path.join(game, "assets.json")) as f:
+        manifest = json.load(f)
+
+    entries = manifest["assets"]
+    keys = [Hash(spec, game) for spec in entries]
+    stale = [i for i in range(len(entries)) if force or Cached(keys[i]) is None]
+    if stale:
+        with ProcessPoolExecutor(jobs) as pool:
+            list(pool.map(Build, [entries[i] for i in stale], [game] * len(stale), [keys[i] for i in stale]))
+
+    packed = []
+    loose = 0
+    for spec, key in zip(entries, keys):
+        for outName, data in Cached(key):
+            if spec.get("pack", spec["type"] != "font"):
+                packed.append((outName, data))
+            else: # written into the game folder as a file of its own
+                path = os.path.join(game, outName)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+                loose += 1
+
+    if packed and manifest.get("pack"):
+        SavePack(os.path.join(game, manifest["pack"]), packed)
+    if packed and manifest.get("frozen"):
+        FreezeAssets(os.path.join(game, manifest["frozen"]), packed)
+    print(f"{name}: {len(entries)} assets, {len(stale)} rebuilt, {len(packed)} packed, {loose} loose")
+
+def Main():
+    parser = argparse.ArgumentParser(description="Build game assets from games/<game>/assets.json")
+    parser.add_argument("games", nargs="*", help="game folder names under games/")
+    parser.add_argument("--all", action="store_true", help="every game that has an assets.json")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rebuild everything, ignoring the cache")
+    args = parser.parse_args()
+
+    games = args.games
+    if args.all:
+        games = sorted(g for g in os.listdir(os.path.join(ROOT, "games"))
+                       if os.path.exists(os.path.join(ROOT, "games", g, "assets.json")))
+    if not games:
+        parser.error("name a game or use --all")
+    for name in games:
+        BuildGame(name, args.jobs, args.force)
+
+if __name__ == "__main__":
+    Main()
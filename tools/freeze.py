@@ -0,0 +1,53 @@
+# PithOS asset freezer
+# Copyright (c) 2026 Henry Gurney
+# Licensed under CC BY-NC-ND 4.0
+
+# Turns game assets into a module of bytes constants to freeze into the firmware, where they're
+# read straight out of flash (see FrozenPack in atomic/frozen.py)
+#
+#   python tools/freeze.py games/picomon/assets.pak -o picomon_assets.py
+#   python tools/freeze.py games/picomon/assets/tilemaps/*.tm --root games/picomon/assets -o maps.py
+#   mpy-cross picomon_assets.py    # check it compiles for the board
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "emulator")) # stand-in micropython module for atomic
+sys.path.insert(1, ROOT)
+
+from atomic.frozen import FreezeAssets
+from atomic.pack import Pack
+
+def Collect(inputs, root):
+    # Every entry of each pack, and each loose file named by its path relative to root
+    files = []
+    for path in inputs:
+        if path.endswith(".pak"):
+            pack = Pack(path)
+            for name in pack.Names():
+                files.append((name, pack.Read(name), pack.Format(name)))
+            pack.Close()
+            continue
+        name = os.path.relpath(path, root or os.path.dirname(path)).replace(os.sep, "/")
+        with open(path, "rb") as f:
+            files.append((name, f.read()))
+    return files
+
+def Main():
+    parser = argparse.ArgumentParser(description="Freeze assets into a module of bytes constants")
+    parser.add_argument("inputs", nargs="+", help=".pak files and/or loose asset files")
+    parser.add_argument("-o", "--output", required=True, help="module to write, e.g. picomon_assets.py")
+    parser.add_argument("--root", help="folder loose file names are relative to (default: each file's own)")
+    args = parser.parse_args()
+
+    files = Collect(args.inputs, args.root)
+    names = [entry[0] for entry in files]
+    if len(set(names)) != len(names):
+        sys.exit("duplicate asset names: " + ", ".join(sorted(n for n in set(names) if names.count(n) > 1)))
+    FreezeAssets(args.output, files)
+    print(f"{args.output}: {len(files)} assets, {sum(len(entry[1]) for entry in files)} bytes")
+
+if __name__ == "__main__":
+    Main()